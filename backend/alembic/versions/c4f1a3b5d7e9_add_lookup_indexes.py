@@ -0,0 +1,52 @@
+"""Add composite indexes for FK + order lookups
+
+Revision ID: c4f1a3b5d7e9
+Revises: b2d4e6f8a0c2
+Create Date: 2025-01-06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a3b5d7e9'
+down_revision: Union[str, None] = 'b2d4e6f8a0c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (索引名, 表名, 列)
+# tasks(workflow_id, task_order) 已由 uq_workflow_task_order 覆盖，
+# routing_branches(step_id) 已由 idx_routing_branches_step_id 覆盖，这里不再重复创建
+INDEXES = [
+    ('ix_examples_step_id_created_at', 'examples', ['step_id', 'created_at']),
+    ('ix_examples_step_id_label', 'examples', ['step_id', 'label']),
+    ('ix_step_notes_step_id_created_at', 'step_notes', ['step_id', 'created_at']),
+    ('ix_workflow_steps_task_id_step_order', 'workflow_steps', ['task_id', 'step_order']),
+    ('ix_workflows_template_id', 'workflows', ['template_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY 不能在事务内执行，需要 autocommit 块；建索引期间不阻塞写入
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
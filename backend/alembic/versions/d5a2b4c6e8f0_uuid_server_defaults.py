@@ -0,0 +1,31 @@
+"""Add gen_random_uuid() server defaults to primary keys
+
+Revision ID: d5a2b4c6e8f0
+Revises: c4f1a3b5d7e9
+Create Date: 2025-01-08
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a2b4c6e8f0'
+down_revision: Union[str, None] = 'c4f1a3b5d7e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tasks / step_notes 建表时已带 gen_random_uuid() 默认值
+TABLES = ['workflows', 'workflow_steps', 'examples', 'routing_branches']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,33 @@
+"""Add server-side defaults to created_at / updated_at
+
+Revision ID: e6b3c5d7f9a1
+Revises: d5a2b4c6e8f0
+Create Date: 2025-01-08
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3c5d7f9a1'
+down_revision: Union[str, None] = 'd5a2b4c6e8f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tasks / step_notes 建表时已带 now() 默认值
+TABLES = ['workflows', 'workflow_steps', 'examples', 'routing_branches']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.func.clock_timestamp())
+        op.alter_column(table, 'updated_at', server_default=sa.func.clock_timestamp())
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=None)
+        op.alter_column(table, 'updated_at', server_default=None)
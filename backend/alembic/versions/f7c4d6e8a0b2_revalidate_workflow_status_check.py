@@ -0,0 +1,50 @@
+"""Recreate ck_workflow_status as NOT VALID and validate it separately
+
+Revision ID: f7c4d6e8a0b2
+Revises: e6b3c5d7f9a1
+Create Date: 2025-01-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c4d6e8a0b2'
+down_revision: Union[str, None] = 'e6b3c5d7f9a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 拿不到锁时快速失败，避免 ALTER 排队阻塞 workflows 上的后续读写
+LOCK_TIMEOUT = '2s'
+
+WORKFLOW_STATUSES = ('draft', 'worker_done', 'expert_done', 'analyzed', 'confirmed', 'delivered')
+
+
+def _replace_status_constraint(statuses: Sequence[str]) -> None:
+    """以 NOT VALID 方式重建 ck_workflow_status，再在独立事务中校验。
+
+    DROP 与 ADD 合并为一条 ALTER，只加一次锁且不存在无约束的窗口；
+    VALIDATE 只持有 SHARE UPDATE EXCLUSIVE 锁，扫描期间不阻塞读写。
+    两步都可重复执行，VALIDATE 失败后重新运行本迁移即可恢复。
+    """
+    values = ", ".join(f"'{status}'" for status in statuses)
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute(
+        "ALTER TABLE workflows "
+        "DROP CONSTRAINT IF EXISTS ck_workflow_status, "
+        f"ADD CONSTRAINT ck_workflow_status CHECK (status IN ({values})) NOT VALID"
+    )
+    # 提交上面的 ALTER 以释放 ACCESS EXCLUSIVE 锁，再单独校验
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE workflows VALIDATE CONSTRAINT ck_workflow_status")
+
+
+def upgrade() -> None:
+    _replace_status_constraint(WORKFLOW_STATUSES)
+
+
+def downgrade() -> None:
+    # 上一版本中的约束定义相同，同样校验后再回退
+    _replace_status_constraint(WORKFLOW_STATUSES)
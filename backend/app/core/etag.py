@@ -0,0 +1,64 @@
+"""ETag support for read-mostly JSON endpoints."""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def make_etag(*version: object) -> str:
+    """Build an ETag from a cheap version of the data behind a response.
+
+    version 由调用方在执行列表查询之前取得（如各表的行数与 max(updated_at)），
+    连同影响结果的查询参数一起传入；任何一项变化都会得到新的 ETag。
+    """
+    return _digest(repr(version).encode())
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match matches etag.
+
+    与 make_etag 配合、先于列表查询调用：命中时省去查询、序列化与响应体传输。
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
+
+
+def etag_response(
+    request: Request,
+    payload: BaseModel,
+    etag: Optional[str] = None,
+) -> Response:
+    """Serialize payload and answer with an ETag, or 304 if the client copy is current.
+
+    未传入 etag 时取响应体的 blake2b 摘要：查询与序列化照常执行，
+    命中时只省去响应体的传输与前端的重新解析。
+    """
+    body = payload.model_dump_json().encode()
+    if etag is None:
+        etag = _digest(body)
+
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _digest(data: bytes) -> str:
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match 可以是 "*" 或逗号分隔的列表，弱校验比较忽略 W/ 前缀
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,44 @@
+"""Application logging setup."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def start_logging(level: int = logging.INFO) -> None:
+    """Route root logger records through a queue to a background stream handler.
+
+    请求协程只把日志记录放入内存队列，由监听线程负责格式化与写 stdout，
+    错误集中出现时不会因同步 I/O 阻塞事件循环。
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (called on shutdown)."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in logging.getLogger().handlers[:]:
+        if isinstance(handler, QueueHandler):
+            logging.getLogger().removeHandler(handler)
+    _listener = None
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 """FastAPI application entry point."""
 
-import os
+from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import get_settings
+from app.core.database import dispose_engine, warm_up_pool
+from app.core.log import start_logging, stop_logging
 from app.routers import (
     analysis_router,
     example_router,
@@ -21,9 +24,30 @@ from app.routers import (
     status_router,
 )
 from app.routers.step_simple import router as step_simple_router
+from app.services.analysis_job import cancel_analysis_jobs
+from app.services.llm import close_llm_service, get_llm_service
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: create shared clients on startup, release on shutdown."""
+    start_logging()
+    # 上传目录只需在启动时创建一次
+    Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
+    # LLM 客户端全进程共享一个实例，复用连接池，避免每次调用重新握手
+    get_llm_service()
+    # 预热数据库连接池
+    await warm_up_pool()
+    yield
+    # 先取消仍在运行的后台分析，再释放其依赖的 LLM 客户端与连接池
+    await cancel_analysis_jobs()
+    await close_llm_service()
+    await dispose_engine()
+    stop_logging()
+
+
 app = FastAPI(
     title=settings.app_name,
     description="专家经验数字化编译平台 - 将业务专家的直觉与流程编译为 AI 可执行的协议",
@@ -31,6 +55,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware
@@ -42,9 +67,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create uploads directory and mount static files
-os.makedirs(settings.upload_dir, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=settings.upload_dir), name="uploads")
+# Mount static files（目录在 lifespan 中创建，挂载时不再检查目录是否存在）
+# 生产环境建议由 nginx 直接提供 /uploads，不经过 Python 进程
+app.mount(
+    "/uploads",
+    StaticFiles(directory=settings.upload_dir, check_dir=False),
+    name="uploads",
+)
 
 
 @app.get("/health")
@@ -1,27 +1,50 @@
 """Base SQLAlchemy model with common fields."""
 
+import uuid
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
-
-from app.core.database import Base
+from sqlalchemy.orm import Mapped, mapped_column
 
 
 class TimestampMixin:
-    """Mixin for timestamp fields."""
+    """Mixin for timestamp fields.
+
+    时间戳由数据库生成。使用 clock_timestamp() 而不是 now()：
+    同一事务内批量插入的行也能按 created_at 保持插入顺序。
+    eager_defaults 让 INSERT/UPDATE 通过 RETURNING 取回生成值，
+    避免之后访问属性时再触发一次加载（异步会话下会直接报错）。
+    """
 
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.clock_timestamp(),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.clock_timestamp(),
+        onupdate=func.clock_timestamp(),
         nullable=False,
     )
 
+    __mapper_args__ = {"eager_defaults": True}
 
-class UUIDMixin:
-    """Mixin for UUID primary key."""
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+class UUIDMixin:
+    """Mixin for UUID primary key.
+
+    ORM 插入仍在 Python 侧生成 UUID，server_default 供原生 SQL / INSERT ... SELECT
+    等绕过 ORM 的写入使用。insert_sentinel 让批量 flush 在 eager_defaults 需要
+    RETURNING 时仍能合并为多行 INSERT（按主键对齐返回行），而不是退化为逐行 INSERT。
+    """
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+        server_default=text("gen_random_uuid()"),
+        insert_sentinel=True,
+    )
@@ -1,18 +1,23 @@
 """Workflow and related SQLAlchemy models."""
 
+import uuid
+from typing import Optional
+
 from sqlalchemy import (
     ARRAY,
     Boolean,
     CheckConstraint,
-    Column,
     ForeignKey,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    func,
+    select,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import TimestampMixin, UUIDMixin
@@ -23,30 +28,32 @@ class Workflow(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "workflows"
 
-    name = Column(String(255), nullable=False)
-    description = Column(Text)
-    cover_image_url = Column(String(500))
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    cover_image_url: Mapped[Optional[str]] = mapped_column(String(500))
     # 状态：draft(草稿) -> worker_done(工人完成) -> expert_done(专家完成) 
     #       -> analyzed(已分析) -> confirmed(已确认) -> delivered(已交付)
-    status = Column(String(20), default="draft", nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="draft", nullable=False)
     # 是否为模板
-    is_template = Column(Boolean, default=False)
+    is_template: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     # 从哪个模板创建的
-    template_id = Column(UUID(as_uuid=True), ForeignKey("workflows.id"), nullable=True)
+    template_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("workflows.id"), nullable=True)
 
     # Relationships
-    tasks = relationship(
+    tasks: Mapped[list["Task"]] = relationship(
         "Task",
         back_populates="workflow",
         cascade="all, delete-orphan",
         order_by="Task.task_order",
+        lazy="selectin",
     )
     # 保留旧的 steps 关系以兼容
-    steps = relationship(
+    steps: Mapped[list["WorkflowStep"]] = relationship(
         "WorkflowStep",
         back_populates="workflow",
         cascade="all, delete-orphan",
         order_by="WorkflowStep.step_order",
+        lazy="selectin",
     )
 
     __table_args__ = (
@@ -62,25 +69,46 @@ class Task(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "tasks"
 
-    workflow_id = Column(
+    workflow_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workflows.id", ondelete="CASCADE"),
         nullable=False,
     )
-    name = Column(String(255), nullable=False)  # 如 "抄表"
-    task_order = Column(Integer, nullable=False)  # 1, 2, 3...
-    description = Column(Text)  # 专家填写的详细说明
-    status = Column(String(20), default="pending", nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)  # 如 "抄表"
+    task_order: Mapped[int] = mapped_column(Integer, nullable=False)  # 1, 2, 3...
+    description: Mapped[Optional[str]] = mapped_column(Text)  # 专家填写的详细说明
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
 
     # Relationships
-    workflow = relationship("Workflow", back_populates="tasks")
-    steps = relationship(
+    workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="tasks")
+    steps: Mapped[list["WorkflowStep"]] = relationship(
         "WorkflowStep",
         back_populates="task",
         cascade="all, delete-orphan",
         order_by="WorkflowStep.step_order",
+        lazy="selectin",
     )
 
+    @hybrid_property
+    def steps_count(self) -> int:
+        """Number of steps (requires ``steps`` to be loaded)."""
+        return len(self.steps)
+
+    @steps_count.inplace.expression
+    @classmethod
+    def _steps_count_expression(cls):
+        # 关联子查询，select(Task, Task.steps_count) 即可随任务一并取回步骤数；
+        # 用 count(*) 而非 count(id)，可直接走 ix_workflow_steps_task_id_step_order
+        # 做仅索引扫描，无需回表
+        return (
+            select(func.count())
+            .select_from(WorkflowStep)
+            .where(WorkflowStep.task_id == cls.id)
+            .correlate_except(WorkflowStep)
+            .scalar_subquery()
+            .label("steps_count")
+        )
+
     __table_args__ = (
         UniqueConstraint("workflow_id", "task_order", name="uq_workflow_task_order"),
         CheckConstraint(
@@ -94,61 +122,65 @@ class WorkflowStep(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "workflow_steps"
 
-    workflow_id = Column(
+    workflow_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workflows.id", ondelete="CASCADE"),
         nullable=False,
     )
     # 新增：关联到 Task
-    task_id = Column(
+    task_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("tasks.id", ondelete="CASCADE"),
         nullable=True,  # 允许为空，兼容旧数据
     )
-    name = Column(String(255), nullable=False)
-    step_order = Column(Integer, nullable=False)
-    status = Column(String(20), default="pending", nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    step_order: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
 
     # Context (Micro-Step A) - 工人填写
-    context_type = Column(String(20))
-    context_image_url = Column(String(500))
-    context_text_content = Column(Text)
-    context_voice_transcript = Column(Text)
-    context_description = Column(Text)
+    context_type: Mapped[Optional[str]] = mapped_column(String(20))
+    context_image_url: Mapped[Optional[str]] = mapped_column(String(500))
+    context_text_content: Mapped[Optional[str]] = mapped_column(Text)
+    context_voice_transcript: Mapped[Optional[str]] = mapped_column(Text)
+    context_description: Mapped[Optional[str]] = mapped_column(Text)
 
     # Extraction (Micro-Step B)
-    extraction_keywords = Column(ARRAY(Text))
-    extraction_voice_transcript = Column(Text)
+    extraction_keywords: Mapped[Optional[list[str]]] = mapped_column(ARRAY(Text))
+    extraction_voice_transcript: Mapped[Optional[str]] = mapped_column(Text)
 
     # Logic (Micro-Step C)
-    logic_strategy = Column(String(20))
-    logic_rule_expression = Column(Text)
-    logic_evaluation_prompt = Column(Text)
+    logic_strategy: Mapped[Optional[str]] = mapped_column(String(20))
+    logic_rule_expression: Mapped[Optional[str]] = mapped_column(Text)
+    logic_evaluation_prompt: Mapped[Optional[str]] = mapped_column(Text)
 
     # Routing (Micro-Step D)
-    routing_default_next = Column(String(100))
+    routing_default_next: Mapped[Optional[str]] = mapped_column(String(100))
     
     # 专家整理的内容
-    expert_notes = Column(Text)
+    expert_notes: Mapped[Optional[str]] = mapped_column(Text)
 
     # Relationships
-    workflow = relationship("Workflow", back_populates="steps")
-    task = relationship("Task", back_populates="steps")
-    examples = relationship(
+    workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="steps")
+    task: Mapped[Optional["Task"]] = relationship("Task", back_populates="steps")
+    examples: Mapped[list["Example"]] = relationship(
         "Example",
         back_populates="step",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
-    routing_branches = relationship(
+    routing_branches: Mapped[list["RoutingBranch"]] = relationship(
         "RoutingBranch",
         back_populates="step",
         cascade="all, delete-orphan",
+        order_by="RoutingBranch.created_at",
+        lazy="selectin",
     )
-    notes = relationship(
+    notes: Mapped[list["StepNote"]] = relationship(
         "StepNote",
         back_populates="step",
         cascade="all, delete-orphan",
         order_by="StepNote.created_at",
+        lazy="selectin",
     )
 
     __table_args__ = (
@@ -172,22 +204,22 @@ class StepNote(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "step_notes"
 
-    step_id = Column(
+    step_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workflow_steps.id", ondelete="CASCADE"),
         nullable=False,
     )
     # 内容类型：image/voice/video/text
-    content_type = Column(String(20), nullable=False)
+    content_type: Mapped[str] = mapped_column(String(20), nullable=False)
     # 内容：URL（图片/语音/视频）或文本内容
-    content = Column(Text, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
     # 语音转文字结果（占位）
-    voice_transcript = Column(Text)
+    voice_transcript: Mapped[Optional[str]] = mapped_column(Text)
     # 创建者：worker/expert
-    created_by = Column(String(20), default="worker")
+    created_by: Mapped[Optional[str]] = mapped_column(String(20), default="worker")
 
     # Relationships
-    step = relationship("WorkflowStep", back_populates="notes")
+    step: Mapped["WorkflowStep"] = relationship("WorkflowStep", back_populates="notes")
 
     __table_args__ = (
         CheckConstraint(
@@ -206,18 +238,18 @@ class Example(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "examples"
 
-    step_id = Column(
+    step_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workflow_steps.id", ondelete="CASCADE"),
         nullable=False,
     )
-    content = Column(Text, nullable=False)
-    content_type = Column(String(20))
-    label = Column(String(10), nullable=False)
-    description = Column(Text)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_type: Mapped[Optional[str]] = mapped_column(String(20))
+    label: Mapped[str] = mapped_column(String(10), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
 
     # Relationships
-    step = relationship("WorkflowStep", back_populates="examples")
+    step: Mapped["WorkflowStep"] = relationship("WorkflowStep", back_populates="examples")
 
     __table_args__ = (
         CheckConstraint(
@@ -233,15 +265,15 @@ class RoutingBranch(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "routing_branches"
 
-    step_id = Column(
+    step_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workflow_steps.id", ondelete="CASCADE"),
         nullable=False,
     )
-    condition_result = Column(String(100), nullable=False)
-    action_type = Column(String(100), nullable=False)
-    next_step_id = Column(String(100), nullable=False)
+    condition_result: Mapped[str] = mapped_column(String(100), nullable=False)
+    action_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    next_step_id: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Relationships
-    step = relationship("WorkflowStep", back_populates="routing_branches")
+    step: Mapped["WorkflowStep"] = relationship("WorkflowStep", back_populates="routing_branches")
 
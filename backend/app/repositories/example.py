@@ -3,88 +3,110 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import Example
 
 
+# 预构建的查询语句：模块加载时构造一次，参数通过 bindparam 在执行时传入
+_SELECT_BY_STEP = (
+    select(Example)
+    .where(Example.step_id == bindparam("step_id"))
+    .order_by(Example.created_at)
+)
+_SELECT_BY_STEP_AND_LABEL = (
+    select(Example)
+    .where(Example.step_id == bindparam("step_id"))
+    .where(Example.label == bindparam("label"))
+    .order_by(Example.created_at)
+)
+_EXISTS_BY_ID = select(exists().where(Example.id == bindparam("example_id")))
+_COUNT_BY_STEP = (
+    select(func.count(Example.id))
+    .where(Example.step_id == bindparam("step_id"))
+)
+_COUNT_BY_STEP_AND_LABEL = (
+    select(func.count(Example.id))
+    .where(Example.step_id == bindparam("step_id"))
+    .where(Example.label == bindparam("label"))
+)
+
+
 class ExampleRepository:
-    """Repository for Example CRUD operations."""
+    """Repository for Example CRUD operations.
+
+    写操作只 flush 不 commit，事务边界由 service 层统一控制。
+    """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
 
-    def create(self, example: Example) -> Example:
+    async def create(self, example: Example) -> Example:
         """Create a new example."""
         self.db.add(example)
-        self.db.commit()
-        self.db.refresh(example)
+        await self.db.flush()
         return example
 
-    def get_by_id(self, example_id: UUID) -> Optional[Example]:
-        """Get an example by ID."""
-        stmt = select(Example).where(Example.id == example_id)
-        return self.db.execute(stmt).scalar_one_or_none()
+    async def bulk_create(self, examples: list[Example]) -> list[Example]:
+        """Create multiple examples in a single flush."""
+        self.db.add_all(examples)
+        await self.db.flush()
+        return examples
+
+    async def flush(self) -> None:
+        """Flush pending changes without committing."""
+        await self.db.flush()
+
+    async def get_by_id(self, example_id: UUID) -> Optional[Example]:
+        """Get an example by ID.
 
-    def get_by_step_id(self, step_id: UUID) -> list[Example]:
+        走 Session.get 主键查找：命中 identity map 时不发 SQL。
+        """
+        return await self.db.get(Example, example_id)
+
+    async def get_by_step_id(self, step_id: UUID) -> list[Example]:
         """Get all examples for a step."""
-        stmt = (
-            select(Example)
-            .where(Example.step_id == step_id)
-            .order_by(Example.created_at)
-        )
-        return list(self.db.execute(stmt).scalars().all())
+        result = await self.db.execute(_SELECT_BY_STEP, {"step_id": step_id})
+        return list(result.scalars().all())
 
-    def get_by_step_id_and_label(
+    async def get_by_step_id_and_label(
         self,
         step_id: UUID,
         label: str,
     ) -> list[Example]:
         """Get examples for a step filtered by label."""
-        stmt = (
-            select(Example)
-            .where(Example.step_id == step_id)
-            .where(Example.label == label)
-            .order_by(Example.created_at)
+        result = await self.db.execute(
+            _SELECT_BY_STEP_AND_LABEL,
+            {"step_id": step_id, "label": label},
         )
-        return list(self.db.execute(stmt).scalars().all())
-
+        return list(result.scalars().all())
 
-    def update(self, example: Example, data: dict) -> Example:
+    async def update(self, example: Example, data: dict) -> Example:
         """Update an example with given data."""
         for key, value in data.items():
             if hasattr(example, key):
                 setattr(example, key, value)
-        self.db.commit()
-        self.db.refresh(example)
+        await self.db.flush()
         return example
 
-    def delete(self, example: Example) -> None:
+    async def delete(self, example: Example) -> None:
         """Delete an example."""
-        self.db.delete(example)
-        self.db.commit()
+        await self.db.delete(example)
+        await self.db.flush()
 
-    def exists(self, example_id: UUID) -> bool:
+    async def exists(self, example_id: UUID) -> bool:
         """Check if an example exists."""
-        stmt = select(Example.id).where(Example.id == example_id)
-        return self.db.execute(stmt).scalar_one_or_none() is not None
+        return bool(await self.db.scalar(_EXISTS_BY_ID, {"example_id": example_id}))
 
-    def count_by_step_id(self, step_id: UUID) -> int:
+    async def count_by_step_id(self, step_id: UUID) -> int:
         """Count examples for a step."""
-        from sqlalchemy import func
+        return await self.db.scalar(_COUNT_BY_STEP, {"step_id": step_id})
 
-        stmt = select(func.count(Example.id)).where(Example.step_id == step_id)
-        return self.db.execute(stmt).scalar_one()
-
-    def count_by_step_id_and_label(self, step_id: UUID, label: str) -> int:
+    async def count_by_step_id_and_label(self, step_id: UUID, label: str) -> int:
         """Count examples for a step filtered by label."""
-        from sqlalchemy import func
-
-        stmt = (
-            select(func.count(Example.id))
-            .where(Example.step_id == step_id)
-            .where(Example.label == label)
+        return await self.db.scalar(
+            _COUNT_BY_STEP_AND_LABEL,
+            {"step_id": step_id, "label": label},
         )
-        return self.db.execute(stmt).scalar_one()
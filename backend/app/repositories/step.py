@@ -3,116 +3,239 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
-
-from app.models.workflow import Example, RoutingBranch, WorkflowStep
+from sqlalchemy import Integer, bindparam, delete, exists, false, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.database import get_request_cache, init_empty_collections
+from app.models.workflow import WorkflowStep
+
+
+# 预构建的查询语句：模块加载时构造一次，参数通过 bindparam 在执行时传入
+_SELECT_BY_ID = (
+    select(WorkflowStep)
+    .options(
+        selectinload(WorkflowStep.examples),
+        selectinload(WorkflowStep.routing_branches),
+        selectinload(WorkflowStep.notes),
+    )
+    .where(WorkflowStep.id == bindparam("step_id"))
+)
+_SELECT_BY_WORKFLOW = (
+    select(WorkflowStep)
+    .options(
+        selectinload(WorkflowStep.examples),
+        selectinload(WorkflowStep.routing_branches),
+        raiseload("*"),
+    )
+    .where(WorkflowStep.workflow_id == bindparam("workflow_id"))
+    .order_by(WorkflowStep.step_order)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_COUNT_BY_WORKFLOW = (
+    select(func.count(WorkflowStep.id))
+    .where(WorkflowStep.workflow_id == bindparam("workflow_id"))
+)
+# MAX 走 (workflow_id, step_order) 索引的末端查找，不扫描工作流下的全部步骤
+_MAX_ORDER_BY_WORKFLOW = (
+    select(func.max(WorkflowStep.step_order))
+    .where(WorkflowStep.workflow_id == bindparam("workflow_id"))
+)
+# 一次聚合同时返回最大序号与候选序号是否已被占用；bool_or 需要扫描工作流下的
+# 全部步骤，只用于确实同时需要两个结果的场景
+_ORDER_INFO_BY_WORKFLOW = (
+    select(
+        func.max(WorkflowStep.step_order),
+        func.coalesce(
+            func.bool_or(
+                WorkflowStep.step_order
+                == bindparam("candidate_order", type_=Integer)
+            ),
+            false(),
+        ),
+    )
+    .where(WorkflowStep.workflow_id == bindparam("workflow_id"))
+)
+_EXISTS_BY_ID = select(exists().where(WorkflowStep.id == bindparam("step_id")))
+_EXISTS_BY_ORDER = select(
+    exists()
+    .where(WorkflowStep.workflow_id == bindparam("workflow_id"))
+    .where(WorkflowStep.step_order == bindparam("step_order"))
+)
+# 删除后前移：(workflow_id, step_order) 唯一约束逐行检查，直接 step_order - 1
+# 会与尚未更新的相邻行冲突，因此先取负移出正数区间，再一次性换回目标值
+_SHIFT_OUT_AFTER_ORDER = (
+    update(WorkflowStep)
+    .where(WorkflowStep.workflow_id == bindparam("target_workflow_id"))
+    .where(WorkflowStep.step_order > bindparam("deleted_order"))
+    .values(step_order=-WorkflowStep.step_order)
+    .execution_options(synchronize_session=False)
+)
+_SHIFT_BACK_DECREMENTED = (
+    update(WorkflowStep)
+    .where(WorkflowStep.workflow_id == bindparam("target_workflow_id"))
+    .where(WorkflowStep.step_order < 0)
+    .values(step_order=-WorkflowStep.step_order - 1)
+    .execution_options(synchronize_session=False)
+)
 
 
 class StepRepository:
     """Repository for WorkflowStep CRUD operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
 
-    def create(self, step: WorkflowStep) -> WorkflowStep:
+    async def create(self, step: WorkflowStep) -> WorkflowStep:
         """Create a new workflow step."""
+        # 主键与时间戳由 INSERT ... RETURNING（eager_defaults）回填，无需再 refresh
+        init_empty_collections(step)
         self.db.add(step)
-        self.db.commit()
-        self.db.refresh(step)
+        await self.db.commit()
         return step
 
-    def get_by_id(self, step_id: UUID) -> Optional[WorkflowStep]:
-        """Get a step by ID with all related data."""
-        stmt = (
-            select(WorkflowStep)
-            .options(
-                selectinload(WorkflowStep.examples),
-                selectinload(WorkflowStep.routing_branches),
-                selectinload(WorkflowStep.notes),
-            )
-            .where(WorkflowStep.id == step_id)
-        )
-        return self.db.execute(stmt).scalar_one_or_none()
+    async def get_by_id(self, step_id: UUID) -> Optional[WorkflowStep]:
+        """Get a step by ID with all related data.
+
+        同一请求内重复查询同一步骤时直接返回请求级缓存中的对象。
+        """
+        cache = get_request_cache(self.db)
+        key = (WorkflowStep.__name__, step_id)
+        if key in cache:
+            return cache[key]
+        result = await self.db.execute(_SELECT_BY_ID, {"step_id": step_id})
+        step = result.scalar_one_or_none()
+        if step is not None:
+            cache[key] = step
+        return step
 
-    def get_by_workflow_id(
+    async def get_by_workflow_id(
         self,
         workflow_id: UUID,
         skip: int = 0,
         limit: int = 100,
     ) -> list[WorkflowStep]:
         """Get all steps for a workflow with pagination."""
-        stmt = (
-            select(WorkflowStep)
-            .options(
-                selectinload(WorkflowStep.examples),
-                selectinload(WorkflowStep.routing_branches),
-            )
-            .where(WorkflowStep.workflow_id == workflow_id)
-            .order_by(WorkflowStep.step_order)
-            .offset(skip)
-            .limit(limit)
+        result = await self.db.execute(
+            _SELECT_BY_WORKFLOW,
+            {"workflow_id": workflow_id, "skip": skip, "limit": limit},
         )
-        return list(self.db.execute(stmt).scalars().all())
-
+        return list(result.scalars().all())
 
-    def count_by_workflow_id(self, workflow_id: UUID) -> int:
+    async def count_by_workflow_id(self, workflow_id: UUID) -> int:
         """Count total steps for a workflow."""
-        stmt = select(func.count(WorkflowStep.id)).where(
-            WorkflowStep.workflow_id == workflow_id
+        return await self.db.scalar(_COUNT_BY_WORKFLOW, {"workflow_id": workflow_id})
+
+    async def get_order_info(
+        self,
+        workflow_id: UUID,
+        candidate_order: Optional[int] = None,
+    ) -> tuple[int, bool]:
+        """Get the maximum step_order and whether candidate_order is taken.
+
+        单次查询返回 (max_order, order_taken)；没有步骤时 max_order 为 -1，
+        未传 candidate_order 时 order_taken 恒为 False。
+        """
+        result = await self.db.execute(
+            _ORDER_INFO_BY_WORKFLOW,
+            {"workflow_id": workflow_id, "candidate_order": candidate_order},
         )
-        return self.db.execute(stmt).scalar_one()
+        max_order, order_taken = result.one()
+        return (max_order if max_order is not None else -1), order_taken
 
-    def get_max_order(self, workflow_id: UUID) -> int:
+    async def get_max_order(self, workflow_id: UUID) -> int:
         """Get the maximum step_order for a workflow."""
-        stmt = select(func.max(WorkflowStep.step_order)).where(
-            WorkflowStep.workflow_id == workflow_id
+        max_order = await self.db.scalar(
+            _MAX_ORDER_BY_WORKFLOW, {"workflow_id": workflow_id}
+        )
+        return max_order if max_order is not None else -1
+
+    async def update(self, step: WorkflowStep, data: dict) -> WorkflowStep:
+        """Update a step with given data.
+
+        UPDATE ... RETURNING 一次往返完成写入与回读，不再 commit 后 refresh；
+        SET 的值由 synchronize_session 同步到会话对象，只回读服务端生成的
+        updated_at，避免触发关系的 selectin 重新加载。
+        """
+        values = {
+            key: value for key, value in data.items() if hasattr(WorkflowStep, key)
+        }
+        if not values:
+            return step
+        stmt = (
+            update(WorkflowStep)
+            .where(WorkflowStep.id == step.id)
+            .values(**values)
+            .returning(WorkflowStep.updated_at)
+            .execution_options(synchronize_session="fetch")
         )
-        result = self.db.execute(stmt).scalar_one_or_none()
-        return result if result is not None else -1
-
-    def update(self, step: WorkflowStep, data: dict) -> WorkflowStep:
-        """Update a step with given data."""
-        for key, value in data.items():
-            if hasattr(step, key):
-                setattr(step, key, value)
-        self.db.commit()
-        self.db.refresh(step)
+        updated_at = (await self.db.execute(stmt)).scalar_one()
+        set_committed_value(step, "updated_at", updated_at)
+        await self.db.commit()
         return step
 
-    def delete(self, step: WorkflowStep) -> None:
+    async def delete(self, step: WorkflowStep) -> None:
         """Delete a step."""
-        self.db.delete(step)
-        self.db.commit()
+        await self.db.delete(step)
+        await self.db.commit()
 
-    def exists(self, step_id: UUID) -> bool:
+    async def delete_by_id(
+        self,
+        step_id: UUID,
+        workflow_id: Optional[UUID] = None,
+    ) -> Optional[tuple[UUID, int]]:
+        """Delete a step by ID without loading it.
+
+        子表外键均为 ON DELETE CASCADE，由数据库级联删除；通过 RETURNING
+        取回重排所需的 workflow_id 与 step_order。
+
+        Args:
+            step_id: The step UUID
+            workflow_id: If given, only delete the step when it belongs to this workflow
+
+        Returns:
+            (workflow_id, step_order) of the deleted step, or None if no row matched.
+        """
+        stmt = delete(WorkflowStep).where(WorkflowStep.id == step_id)
+        if workflow_id is not None:
+            stmt = stmt.where(WorkflowStep.workflow_id == workflow_id)
+        stmt = stmt.returning(
+            WorkflowStep.workflow_id, WorkflowStep.step_order
+        ).execution_options(synchronize_session=False)
+        row = (await self.db.execute(stmt)).one_or_none()
+        await self.db.commit()
+        return tuple(row) if row is not None else None
+
+    async def exists(self, step_id: UUID) -> bool:
         """Check if a step exists."""
-        stmt = select(WorkflowStep.id).where(WorkflowStep.id == step_id)
-        return self.db.execute(stmt).scalar_one_or_none() is not None
+        return bool(await self.db.scalar(_EXISTS_BY_ID, {"step_id": step_id}))
 
-    def reorder_steps_after_delete(
+    async def reorder_steps_after_delete(
         self,
         workflow_id: UUID,
         deleted_order: int,
     ) -> None:
-        """Reorder steps after a step is deleted."""
-        stmt = (
-            select(WorkflowStep)
-            .where(WorkflowStep.workflow_id == workflow_id)
-            .where(WorkflowStep.step_order > deleted_order)
-            .order_by(WorkflowStep.step_order)
+        """Reorder steps after a step is deleted.
+
+        两条集合 UPDATE 完成前移，不加载任何 ORM 对象。
+        """
+        await self.db.execute(
+            _SHIFT_OUT_AFTER_ORDER,
+            {"target_workflow_id": workflow_id, "deleted_order": deleted_order},
+        )
+        await self.db.execute(
+            _SHIFT_BACK_DECREMENTED, {"target_workflow_id": workflow_id}
         )
-        steps = list(self.db.execute(stmt).scalars().all())
-        for step in steps:
-            step.step_order -= 1
-        self.db.commit()
+        await self.db.commit()
 
-    def check_order_exists(self, workflow_id: UUID, step_order: int) -> bool:
+    async def check_order_exists(self, workflow_id: UUID, step_order: int) -> bool:
         """Check if a step with given order exists in workflow."""
-        stmt = (
-            select(WorkflowStep.id)
-            .where(WorkflowStep.workflow_id == workflow_id)
-            .where(WorkflowStep.step_order == step_order)
+        return bool(
+            await self.db.scalar(
+                _EXISTS_BY_ORDER,
+                {"workflow_id": workflow_id, "step_order": step_order},
+            )
         )
-        return self.db.execute(stmt).scalar_one_or_none() is not None
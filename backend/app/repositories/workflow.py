@@ -3,75 +3,205 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Row, bindparam, delete, exists, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defaultload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.workflow import Workflow, WorkflowStep
+from app.core.database import get_request_cache, init_empty_collections
+from app.models.workflow import Task, Workflow, WorkflowStep
+
+
+# 预构建的查询语句：模块加载时构造一次，参数通过 bindparam 在执行时传入
+_SELECT_BY_ID = (
+    select(Workflow)
+    .options(
+        selectinload(Workflow.steps)
+        .selectinload(WorkflowStep.examples),
+        selectinload(Workflow.steps)
+        .selectinload(WorkflowStep.routing_branches),
+        selectinload(Workflow.steps)
+        .selectinload(WorkflowStep.notes),
+        selectinload(Workflow.tasks)
+        .selectinload(Task.steps)
+        .selectinload(WorkflowStep.notes),
+    )
+    .where(Workflow.id == bindparam("workflow_id"))
+)
+# 协议生成只读取步骤及其示例、路由分支；步骤上其余关系（notes 等映射层默认
+# selectin 的关系）显式改为 raiseload，不随步骤一并加载。
+# sql_only=True 允许 step.workflow 这类可从身份映射直接取得的多对一引用
+_SELECT_FOR_PROTOCOL = (
+    select(Workflow)
+    .options(
+        selectinload(Workflow.steps)
+        .selectinload(WorkflowStep.examples),
+        selectinload(Workflow.steps)
+        .selectinload(WorkflowStep.routing_branches),
+        defaultload(Workflow.steps).raiseload("*", sql_only=True),
+        raiseload("*", sql_only=True),
+    )
+    .where(Workflow.id == bindparam("workflow_id"))
+)
+# 列表只需要摘要字段：关闭关系上默认的 selectin 预加载，
+# raiseload 让任何意外的关系访问直接报错，而不是悄悄产生 N+1 查询
+_SELECT_ALL = (
+    select(Workflow)
+    .options(raiseload("*"))
+    .order_by(Workflow.updated_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# 列表摘要投影：只取 WorkflowSummary 需要的列，跳过 ORM 对象构建与身份映射
+_SELECT_ALL_SUMMARY = (
+    select(
+        Workflow.id,
+        Workflow.name,
+        Workflow.description,
+        Workflow.cover_image_url,
+        Workflow.status,
+        Workflow.created_at,
+        Workflow.updated_at,
+    )
+    .order_by(Workflow.updated_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_COUNT = select(func.count(Workflow.id))
+# 一次往返：规划器估算（reltuples，从未 ANALYZE 时为 -1）达到阈值时直接返回估算值，
+# 否则返回精确 COUNT(*)；不相关子查询作为 InitPlan 只在 ELSE 分支命中时才执行
+_COUNT_FOR_LISTING = text(
+    "SELECT CASE WHEN c.reltuples >= :exact_below THEN c.reltuples::bigint "
+    "ELSE (SELECT count(*) FROM workflows) END "
+    "FROM pg_class c WHERE c.oid = 'workflows'::regclass"
+)
+_EXISTS_BY_ID = select(exists().where(Workflow.id == bindparam("workflow_id")))
 
 
 class WorkflowRepository:
     """Repository for Workflow CRUD operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
 
-    def create(self, workflow: Workflow) -> Workflow:
+    async def create(self, workflow: Workflow) -> Workflow:
         """Create a new workflow."""
+        # 主键与时间戳由 INSERT ... RETURNING（eager_defaults）回填，无需再 refresh
+        init_empty_collections(workflow)
         self.db.add(workflow)
-        self.db.commit()
-        self.db.refresh(workflow)
+        await self.db.commit()
         return workflow
 
-    def get_by_id(self, workflow_id: UUID) -> Optional[Workflow]:
-        """Get a workflow by ID with all related data."""
-        stmt = (
-            select(Workflow)
-            .options(
-                selectinload(Workflow.steps)
-                .selectinload(WorkflowStep.examples),
-                selectinload(Workflow.steps)
-                .selectinload(WorkflowStep.routing_branches),
-            )
-            .where(Workflow.id == workflow_id)
+    async def get_by_id(self, workflow_id: UUID) -> Optional[Workflow]:
+        """Get a workflow by ID with all related data.
+
+        同一请求内重复查询同一工作流时直接返回请求级缓存中的对象。
+        """
+        cache = get_request_cache(self.db)
+        key = (Workflow.__name__, workflow_id)
+        if key in cache:
+            return cache[key]
+        result = await self.db.execute(_SELECT_BY_ID, {"workflow_id": workflow_id})
+        workflow = result.scalar_one_or_none()
+        if workflow is not None:
+            cache[key] = workflow
+        return workflow
+
+    async def get_for_protocol(self, workflow_id: UUID) -> Optional[Workflow]:
+        """Get a workflow with only the relations needed to build its protocol.
+
+        请求级缓存中已有完整加载的工作流时直接复用。
+        """
+        cached = get_request_cache(self.db).get((Workflow.__name__, workflow_id))
+        if cached is not None:
+            return cached
+        result = await self.db.execute(
+            _SELECT_FOR_PROTOCOL, {"workflow_id": workflow_id}
         )
-        return self.db.execute(stmt).scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-    def get_all(
+    async def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
     ) -> list[Workflow]:
         """Get all workflows with pagination."""
-        stmt = (
-            select(Workflow)
-            .order_by(Workflow.updated_at.desc())
-            .offset(skip)
-            .limit(limit)
+        result = await self.db.execute(_SELECT_ALL, {"skip": skip, "limit": limit})
+        return list(result.scalars().all())
+
+    async def get_all_summary(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Row]:
+        """Get summary rows for all workflows with pagination.
+
+        与 get_all 排序一致，但返回列投影的 Row 而不是 Workflow 实体。
+        """
+        result = await self.db.execute(
+            _SELECT_ALL_SUMMARY, {"skip": skip, "limit": limit}
         )
-        return list(self.db.execute(stmt).scalars().all())
+        return list(result.all())
 
-    def count(self) -> int:
+    async def count(self) -> int:
         """Count total workflows."""
-        stmt = select(func.count(Workflow.id))
-        return self.db.execute(stmt).scalar_one()
+        return await self.db.scalar(_COUNT)
+
+    async def count_for_listing(self, exact_below: int) -> int:
+        """Count workflows for list pagination in a single query.
 
+        表较小（估算行数低于 exact_below）时返回精确值，否则返回统计信息中的估算值。
+        """
+        return await self.db.scalar(_COUNT_FOR_LISTING, {"exact_below": exact_below})
 
-    def update(self, workflow: Workflow, data: dict) -> Workflow:
-        """Update a workflow with given data."""
-        for key, value in data.items():
-            if hasattr(workflow, key) and value is not None:
-                setattr(workflow, key, value)
-        self.db.commit()
-        self.db.refresh(workflow)
+    async def update(self, workflow: Workflow, data: dict) -> Workflow:
+        """Update a workflow with given data.
+
+        UPDATE ... RETURNING 一次往返完成写入与回读，不再 commit 后 refresh；
+        SET 的值由 synchronize_session 同步到会话对象，只回读服务端生成的
+        updated_at，避免触发关系的 selectin 重新加载。
+        """
+        values = {
+            key: value
+            for key, value in data.items()
+            if hasattr(Workflow, key) and value is not None
+        }
+        if not values:
+            return workflow
+        stmt = (
+            update(Workflow)
+            .where(Workflow.id == workflow.id)
+            .values(**values)
+            .returning(Workflow.updated_at)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated_at = (await self.db.execute(stmt)).scalar_one()
+        set_committed_value(workflow, "updated_at", updated_at)
+        await self.db.commit()
         return workflow
 
-    def delete(self, workflow: Workflow) -> None:
+    async def delete(self, workflow: Workflow) -> None:
         """Delete a workflow."""
-        self.db.delete(workflow)
-        self.db.commit()
+        await self.db.delete(workflow)
+        await self.db.commit()
+
+    async def delete_by_id(self, workflow_id: UUID) -> bool:
+        """Delete a workflow by ID without loading it.
+
+        子表外键均为 ON DELETE CASCADE，由数据库级联删除，无需先加载对象及其子行。
+
+        Returns:
+            True if a row was deleted, False if the workflow does not exist.
+        """
+        result = await self.db.execute(
+            delete(Workflow)
+            .where(Workflow.id == workflow_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
 
-    def exists(self, workflow_id: UUID) -> bool:
+    async def exists(self, workflow_id: UUID) -> bool:
         """Check if a workflow exists."""
-        stmt = select(Workflow.id).where(Workflow.id == workflow_id)
-        return self.db.execute(stmt).scalar_one_or_none() is not None
+        return bool(await self.db.scalar(_EXISTS_BY_ID, {"workflow_id": workflow_id}))
@@ -1,13 +1,16 @@
 """Analysis API router for AI-powered sample analysis."""
 
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import get_async_db
+from app.repositories.step import StepRepository
 from app.services.ai_analysis import (
     AIAnalysisService,
     AnalysisError,
@@ -15,6 +18,12 @@ from app.services.ai_analysis import (
     InsufficientExamplesError,
     StepNotFoundError,
 )
+from app.services.analysis_job import (
+    AnalysisJobQueueFullError,
+    AnalysisJobResponse,
+    get_analysis_job,
+    submit_analysis_job,
+)
 from app.services.llm import get_llm_service
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
@@ -40,10 +49,10 @@ class AnalyzeStepRequest(BaseModel):
     **Context Awareness:** Pass previous_outputs to ensure consistent variable naming.
     """,
 )
-def analyze_step_examples(
+async def analyze_step_examples(
     step_id: UUID,
     request: Optional[AnalyzeStepRequest] = Body(default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> AnalysisResponse:
     """
     Analyze a step using LLM and generate data contract.
@@ -70,7 +79,7 @@ def analyze_step_examples(
     previous_outputs = request.previous_outputs if request else None
     
     try:
-        result = service.analyze_step_examples(step_id, previous_outputs)
+        result = await service.analyze_step_examples(step_id, previous_outputs)
         return result
         
     except StepNotFoundError:
@@ -90,20 +99,102 @@ def analyze_step_examples(
         )
 
 
+@router.post(
+    "/steps/{step_id}/analyze/jobs",
+    response_model=AnalysisJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit step analysis as a background job",
+    description="""
+    Same analysis as POST /steps/{step_id}/analyze, but returns immediately
+    with a job_id. Poll GET /jobs/{job_id} until state is done or error.
+    """,
+)
+async def submit_analyze_step_job(
+    step_id: UUID,
+    request: Optional[AnalyzeStepRequest] = Body(default=None),
+    db: AsyncSession = Depends(get_async_db),
+) -> AnalysisJobResponse:
+    """
+    Submit a step analysis job.
+    
+    Args:
+        step_id: UUID of the step to analyze
+        request: Optional request body with previous_outputs
+        db: Database session
+        
+    Returns:
+        The pending AnalysisJobResponse
+    """
+    if not get_llm_service().is_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM service is disabled. Please enable it in configuration.",
+        )
+
+    # 提交前确认步骤存在，不存在时直接 404 而不是产生一个必然失败的任务
+    if not await StepRepository(db).exists(step_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Step with id {step_id} not found",
+        )
+
+    previous_outputs = request.previous_outputs if request else None
+    try:
+        return submit_analysis_job(step_id, previous_outputs)
+    except AnalysisJobQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=AnalysisJobResponse,
+    summary="Get background analysis job state",
+)
+async def get_analyze_step_job(job_id: UUID) -> AnalysisJobResponse:
+    """
+    Get the state of a background analysis job.
+    
+    Args:
+        job_id: UUID returned by the submit endpoint
+        
+    Returns:
+        AnalysisJobResponse with state, and result or error once finished
+    """
+    job = get_analysis_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analysis job {job_id} not found",
+        )
+    return job
+
+
 @router.get(
     "/status",
     summary="Check LLM service status",
     description="Check if the LLM service is enabled and properly configured.",
 )
-def get_llm_status() -> dict:
+async def get_llm_status() -> dict:
     """
     Get LLM service status.
     
     Returns:
         Dict with enabled status, provider, and model info.
     """
-    from app.core.config import get_settings
-    
+    return _build_llm_status()
+
+
+@lru_cache(maxsize=1)
+def _build_llm_status() -> dict:
+    """
+    构建 LLM 状态响应。
+
+    配置在运行期不可变，结果在首次调用后缓存；如需重新加载配置，
+    调用 ``_build_llm_status.cache_clear()`` 使其失效。
+    """
     settings = get_settings()
     llm_service = get_llm_service()
     
@@ -4,11 +4,12 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.workflow import (
     ExampleCreate,
+    ExampleLabel,
     ExampleResponse,
     ExampleUpdate,
 )
@@ -20,8 +21,15 @@ from app.services.example import (
 
 router = APIRouter(tags=["examples"])
 
+# label 过滤 -> ExampleService 方法名；按名称取方法以兼容依赖覆盖注入的服务实例
+_LIST_METHOD_BY_LABEL: dict[ExampleLabel | None, str] = {
+    "PASS": "list_passing_examples",
+    "FAIL": "list_failing_examples",
+    None: "list_examples_by_step",
+}
 
-def get_example_service(db: Session = Depends(get_db)) -> ExampleService:
+
+def get_example_service(db: AsyncSession = Depends(get_async_db)) -> ExampleService:
     """Dependency to get example service."""
     return ExampleService(db)
 
@@ -33,10 +41,9 @@ def get_example_service(db: Session = Depends(get_db)) -> ExampleService:
 async def list_examples(
     step_id: UUID,
     service: Annotated[ExampleService, Depends(get_example_service)],
-    label: str | None = Query(
+    label: ExampleLabel | None = Query(
         None,
         description="Filter by label (PASS or FAIL)",
-        pattern="^(PASS|FAIL)$",
     ),
 ) -> list[ExampleResponse]:
     """
@@ -46,11 +53,8 @@ async def list_examples(
     - **label**: Optional filter by label (PASS or FAIL)
     """
     try:
-        if label == "PASS":
-            return service.list_passing_examples(step_id)
-        elif label == "FAIL":
-            return service.list_failing_examples(step_id)
-        return service.list_examples_by_step(step_id)
+        list_examples = getattr(service, _LIST_METHOD_BY_LABEL[label])
+        return await list_examples(step_id)
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -83,7 +87,32 @@ async def create_example(
     and examples uploaded to the failing zone should have label='FAIL'.
     """
     try:
-        return service.create_example(step_id, data)
+        return await service.create_example(step_id, data)
+    except StepNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/api/steps/{step_id}/examples/batch",
+    response_model=list[ExampleResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_examples(
+    step_id: UUID,
+    data: list[ExampleCreate],
+    service: Annotated[ExampleService, Depends(get_example_service)],
+) -> list[ExampleResponse]:
+    """
+    Create multiple examples for a step in a single request.
+
+    - **step_id**: UUID of the step
+    - **body**: List of examples, each with the same fields as the single create endpoint
+    """
+    try:
+        return await service.create_examples(step_id, data)
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -105,7 +134,7 @@ async def get_example(
     - **example_id**: UUID of the example
     """
     try:
-        return service.get_example(example_id)
+        return await service.get_example(example_id)
     except ExampleNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +158,7 @@ async def update_example(
     - All fields are optional for partial updates
     """
     try:
-        return service.update_example(example_id, data)
+        return await service.update_example(example_id, data)
     except ExampleNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,7 +180,7 @@ async def delete_example(
     - **example_id**: UUID of the example
     """
     try:
-        service.delete_example(example_id)
+        await service.delete_example(example_id)
     except ExampleNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
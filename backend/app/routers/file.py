@@ -1,6 +1,6 @@
 """File upload API router."""
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from pydantic import BaseModel
 
 from app.services.file import (
@@ -8,6 +8,7 @@ from app.services.file import (
     FileSizeExceededError,
     FileUploadError,
     InvalidFileTypeError,
+    get_file_service,
 )
 
 router = APIRouter(prefix="/api/files", tags=["files"])
@@ -41,7 +42,10 @@ class FileDeleteRequest(BaseModel):
     summary="Upload a file",
     description="Upload an image file. Supported formats: JPG, JPEG, PNG, GIF, WEBP, BMP. Max size: 10MB.",
 )
-async def upload_file(file: UploadFile = File(...)) -> FileUploadResponse:
+async def upload_file(
+    file: UploadFile = File(...),
+    file_service: FileService = Depends(get_file_service),
+) -> FileUploadResponse:
     """Upload a file and return its URL.
 
     Args:
@@ -59,18 +63,9 @@ async def upload_file(file: UploadFile = File(...)) -> FileUploadResponse:
             detail="Filename is required",
         )
 
-    file_service = FileService()
-
     try:
-        # Read file content
-        content = await file.read()
-
-        # Upload file
-        url = await file_service.upload_file(
-            file_content=content,
-            filename=file.filename,
-            content_type=file.content_type,
-        )
+        # Upload file（服务内按块流式写入）
+        url = await file_service.upload_file(file)
 
         return FileUploadResponse(
             url=url,
@@ -101,7 +96,10 @@ async def upload_file(file: UploadFile = File(...)) -> FileUploadResponse:
     summary="Delete a file",
     description="Delete a previously uploaded file by its URL.",
 )
-async def delete_file(request: FileDeleteRequest) -> FileDeleteResponse:
+async def delete_file(
+    request: FileDeleteRequest,
+    file_service: FileService = Depends(get_file_service),
+) -> FileDeleteResponse:
     """Delete a file by its URL.
 
     Args:
@@ -110,7 +108,6 @@ async def delete_file(request: FileDeleteRequest) -> FileDeleteResponse:
     Returns:
         FileDeleteResponse indicating success or failure
     """
-    file_service = FileService()
     deleted = await file_service.delete_file(request.url)
 
     if deleted:
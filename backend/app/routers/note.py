@@ -1,9 +1,9 @@
 """StepNote API router."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +12,9 @@ from app.services import note as note_service
 
 router = APIRouter(prefix="/api/notes", tags=["notes"])
 
+# 批量查询单次最多的步骤数，限制 IN 列表长度与响应体大小
+MAX_STEP_IDS_PER_REQUEST = 200
+
 
 # ============================================================================
 # Schemas
@@ -75,6 +78,37 @@ async def get_step_notes(
     )
 
 
+@router.get("/steps", response_model=Dict[UUID, NoteListResponse])
+async def get_notes_for_steps(
+    step_ids: List[UUID] = Query(
+        ..., min_length=1, max_length=MAX_STEP_IDS_PER_REQUEST,
+        description="Step IDs to load notes for (max: 200)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get notes for multiple steps in a single request.
+
+    用于工作流视图一次性加载所有步骤的笔记，避免逐个步骤请求。
+    """
+    notes_by_step = await note_service.get_notes_by_steps(db, step_ids)
+    return {
+        step_id: NoteListResponse(
+            items=[
+                NoteResponse(
+                    id=n.id,
+                    step_id=n.step_id,
+                    content_type=n.content_type,
+                    content=n.content,
+                    voice_transcript=n.voice_transcript,
+                    created_by=n.created_by,
+                )
+                for n in notes
+            ]
+        )
+        for step_id, notes in notes_by_step.items()
+    }
+
+
 @router.post("/step/{step_id}", response_model=NoteResponse)
 async def create_note(
     step_id: UUID,
@@ -3,9 +3,9 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.protocol import ProtocolWorkflow
 from app.services.protocol import ProtocolService, WorkflowNotFoundError
 
@@ -18,9 +18,9 @@ router = APIRouter(prefix="/api/protocol", tags=["protocol"])
     summary="Generate Protocol JSON",
     description="Generate Protocol JSON from a workflow for Agent engine consumption.",
 )
-def get_protocol(
+async def get_protocol(
     workflow_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProtocolWorkflow:
     """Generate and return Protocol JSON for a workflow.
     
@@ -36,7 +36,7 @@ def get_protocol(
     """
     service = ProtocolService(db)
     try:
-        return service.generate_protocol(workflow_id)
+        return await service.generate_protocol(workflow_id)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -4,9 +4,9 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.workflow import (
     RoutingBranchCreate,
     WorkflowStepCreate,
@@ -23,7 +23,7 @@ from app.services.step import (
 router = APIRouter(prefix="/api/workflows", tags=["steps"])
 
 
-def get_step_service(db: Session = Depends(get_db)) -> StepService:
+def get_step_service(db: AsyncSession = Depends(get_async_db)) -> StepService:
     """Dependency to get step service."""
     return StepService(db)
 
@@ -43,7 +43,7 @@ async def list_steps(
     - **page_size**: Number of items per page (default: 100, max: 100)
     """
     try:
-        return service.list_steps(workflow_id, page=page, page_size=page_size)
+        return await service.list_steps(workflow_id, page=page, page_size=page_size)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,8 +76,8 @@ async def create_step(
     """
     try:
         if auto_order:
-            return service.create_step_auto_order(workflow_id, data)
-        return service.create_step(workflow_id, data)
+            return await service.create_step_auto_order(workflow_id, data)
+        return await service.create_step(workflow_id, data)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -106,7 +106,7 @@ async def get_step(
     - **step_id**: UUID of the step
     """
     try:
-        step = service.get_step(step_id)
+        step = await service.get_step(step_id)
         # Verify step belongs to workflow
         if step.workflow_id != workflow_id:
             raise HTTPException(
@@ -140,14 +140,8 @@ async def update_step(
     - All fields are optional for partial updates
     """
     try:
-        # First verify step exists and belongs to workflow
-        step = service.get_step(step_id)
-        if step.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Step {step_id} not found in workflow {workflow_id}",
-            )
-        return service.update_step(step_id, data)
+        # 存在性与归属校验在 service 内随加载一并完成
+        return await service.update_step(step_id, data, workflow_id=workflow_id)
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -178,14 +172,7 @@ async def delete_step(
     Note: Remaining steps will be automatically reordered.
     """
     try:
-        # First verify step exists and belongs to workflow
-        step = service.get_step(step_id)
-        if step.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Step {step_id} not found in workflow {workflow_id}",
-            )
-        service.delete_step(step_id)
+        await service.delete_step(step_id, workflow_id=workflow_id)
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -214,14 +201,7 @@ async def add_routing_branch(
     - **next_step_id**: Next step ID or 'end_process'
     """
     try:
-        # First verify step exists and belongs to workflow
-        step = service.get_step(step_id)
-        if step.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Step {step_id} not found in workflow {workflow_id}",
-            )
-        return service.add_routing_branch(step_id, data)
+        return await service.add_routing_branch(step_id, data, workflow_id=workflow_id)
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -247,14 +227,9 @@ async def remove_routing_branch(
     - **branch_id**: UUID of the branch to remove
     """
     try:
-        # First verify step exists and belongs to workflow
-        step = service.get_step(step_id)
-        if step.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Step {step_id} not found in workflow {workflow_id}",
-            )
-        return service.remove_routing_branch(step_id, branch_id)
+        return await service.remove_routing_branch(
+            step_id, branch_id, workflow_id=workflow_id
+        )
     except StepNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -6,10 +6,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import String, bindparam, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import raiseload
 
 from app.core.database import get_async_db
-from app.models import WorkflowStep
+from app.models import Task, WorkflowStep
 
 router = APIRouter(prefix="/api/steps", tags=["steps-simple"])
 
@@ -35,6 +37,50 @@ class StepResponse(BaseModel):
         from_attributes = True
 
 
+# StepResponse 对应的列，供 RETURNING 直接回读
+_STEP_RESPONSE_COLUMNS = (
+    WorkflowStep.id,
+    WorkflowStep.name,
+    WorkflowStep.step_order,
+    WorkflowStep.context_description,
+    WorkflowStep.expert_notes,
+    WorkflowStep.status,
+)
+
+# 热路径语句在模块级构建一次，按 bindparam 传参，省去每次请求重建语句与计算缓存键
+_SELECT_STEP = (
+    select(WorkflowStep)
+    .options(raiseload("*"))
+    .where(WorkflowStep.id == bindparam("step_id"))
+)
+_SELECT_STEP_FOR_DELETE = select(WorkflowStep).where(
+    WorkflowStep.id == bindparam("step_id")
+)
+# 单条 INSERT ... SELECT：从任务取 workflow_id，同一语句内计算该工作流
+# （而非任务，受唯一约束限制）的下一个 step_order；任务不存在时不插入任何行。
+# 对表而非实体构建 INSERT，否则 ORM 会把执行参数当作批量插入的行；
+# 参数名也需避开 workflow_steps 的列名，否则会被当作 INSERT 的 VALUES
+_INSERT_STEP_FOR_TASK = (
+    insert(WorkflowStep.__table__)
+    .from_select(
+        ["workflow_id", "task_id", "name", "step_order", "status"],
+        select(
+            Task.workflow_id,
+            bindparam("target_task_id", type_=PG_UUID(as_uuid=True)),
+            bindparam("step_name", type_=String),
+            func.coalesce(func.max(WorkflowStep.step_order), 0) + 1,
+            literal("pending", String),
+        )
+        .select_from(Task)
+        .outerjoin(WorkflowStep, WorkflowStep.workflow_id == Task.workflow_id)
+        .where(Task.id == bindparam("target_task_id"))
+        .group_by(Task.workflow_id),
+        include_defaults=False,
+    )
+    .returning(*_STEP_RESPONSE_COLUMNS)
+)
+
+
 @router.patch("/{step_id}", response_model=StepResponse)
 async def update_step_simple(
     step_id: UUID,
@@ -45,33 +91,26 @@ async def update_step_simple(
     Update a step directly by ID (simplified, no workflow_id needed).
     Useful for worker/expert pages to update step content.
     """
+    # 只更新提供了值的字段；UPDATE ... RETURNING 一次往返完成写入与回读
+    values = data.model_dump(exclude_none=True)
+    if not values:
+        return await get_step_simple(step_id, db)
+
     result = await db.execute(
-        select(WorkflowStep).where(WorkflowStep.id == step_id)
+        update(WorkflowStep)
+        .where(WorkflowStep.id == step_id)
+        .values(**values)
+        .returning(*_STEP_RESPONSE_COLUMNS)
+        .execution_options(synchronize_session=False)
     )
-    step = result.scalar_one_or_none()
+    row = result.one_or_none()
     
-    if not step:
+    if not row:
         raise HTTPException(status_code=404, detail="Step not found")
     
-    # Update fields if provided
-    if data.context_description is not None:
-        step.context_description = data.context_description
-    if data.expert_notes is not None:
-        step.expert_notes = data.expert_notes
-    if data.status is not None:
-        step.status = data.status
-    
     await db.commit()
-    await db.refresh(step)
     
-    return StepResponse(
-        id=step.id,
-        name=step.name,
-        step_order=step.step_order,
-        context_description=step.context_description,
-        expert_notes=step.expert_notes,
-        status=step.status,
-    )
+    return StepResponse(**row._mapping)
 
 
 @router.get("/{step_id}", response_model=StepResponse)
@@ -80,9 +119,7 @@ async def get_step_simple(
     db: AsyncSession = Depends(get_async_db),
 ):
     """Get a step by ID (simplified)."""
-    result = await db.execute(
-        select(WorkflowStep).where(WorkflowStep.id == step_id)
-    )
+    result = await db.execute(_SELECT_STEP, {"step_id": step_id})
     step = result.scalar_one_or_none()
     
     if not step:
@@ -115,44 +152,17 @@ async def create_step_for_task(
     Create a new step under a specific task.
     Automatically assigns step_order based on existing steps in the workflow.
     """
-    from app.models import Task
-    from sqlalchemy import func
-    
-    # Verify task exists and get workflow_id
-    task_result = await db.execute(
-        select(Task).where(Task.id == task_id)
+    result = await db.execute(
+        _INSERT_STEP_FOR_TASK,
+        {"target_task_id": task_id, "step_name": data.name},
     )
-    task = task_result.scalar_one_or_none()
-    if not task:
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    # Get next step_order for this WORKFLOW (not task, due to unique constraint)
-    order_result = await db.execute(
-        select(func.coalesce(func.max(WorkflowStep.step_order), 0) + 1)
-        .where(WorkflowStep.workflow_id == task.workflow_id)
-    )
-    next_order = order_result.scalar()
-    
-    # Create the step
-    new_step = WorkflowStep(
-        workflow_id=task.workflow_id,
-        task_id=task_id,
-        name=data.name,
-        step_order=next_order,
-        status="pending",
-    )
-    db.add(new_step)
     await db.commit()
-    await db.refresh(new_step)
     
-    return StepResponse(
-        id=new_step.id,
-        name=new_step.name,
-        step_order=new_step.step_order,
-        context_description=new_step.context_description,
-        expert_notes=new_step.expert_notes,
-        status=new_step.status,
-    )
+    return StepResponse(**row._mapping)
 
 
 @router.delete("/{step_id}")
@@ -161,9 +171,7 @@ async def delete_step(
     db: AsyncSession = Depends(get_async_db),
 ):
     """Delete a step by ID."""
-    result = await db.execute(
-        select(WorkflowStep).where(WorkflowStep.id == step_id)
-    )
+    result = await db.execute(_SELECT_STEP_FOR_DELETE, {"step_id": step_id})
     step = result.scalar_one_or_none()
     
     if not step:
@@ -3,11 +3,12 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
+from app.core.etag import etag_response, make_etag, not_modified
 from app.services import task as task_service
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
@@ -39,6 +40,9 @@ class StepInfo(BaseModel):
     expert_notes: Optional[str] = None
     status: str
 
+    class Config:
+        from_attributes = True
+
 
 class TaskResponse(BaseModel):
     """Response schema for a task."""
@@ -72,34 +76,42 @@ class ReorderRequest(BaseModel):
 @router.get("/workflow/{workflow_id}", response_model=TaskListResponse)
 async def get_workflow_tasks(
     workflow_id: UUID,
+    request: Request,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: Optional[int] = Query(
+        None, ge=1, le=200, description="Items per page (omit to return all tasks)"
+    ),
+    after_order: Optional[int] = Query(
+        None, description="Return tasks after this task_order (cursor, ignores page)"
+    ),
     db: AsyncSession = Depends(get_async_db),
-):
-    """Get all tasks for a workflow."""
-    tasks = await task_service.get_tasks_by_workflow(db, workflow_id)
-    return TaskListResponse(
-        items=[
-            TaskResponse(
-                id=t.id,
-                workflow_id=t.workflow_id,
-                name=t.name,
-                task_order=t.task_order,
-                description=t.description,
-                status=t.status,
-                steps_count=len(t.steps) if t.steps else 0,
-                steps=[
-                    StepInfo(
-                        id=s.id,
-                        name=s.name,
-                        step_order=s.step_order,
-                        context_description=s.context_description,
-                        expert_notes=s.expert_notes,
-                        status=s.status,
-                    )
-                    for s in (t.steps or [])
-                ],
-            )
-            for t in tasks
-        ]
+) -> Response:
+    """Get tasks for a workflow (with ETag / If-None-Match support).
+
+    - **page** / **page_size**: Offset pagination (max page_size: 200)；
+      不传 page_size 时返回全部任务，保持与未分页的调用方兼容
+    - **after_order**: 增量加载时传入上一页最后一个任务的 task_order
+    """
+    # 先用行数与 max(updated_at) 组成 ETag，命中时不执行列表查询
+    etag = make_etag(
+        await task_service.get_tasks_version(db, workflow_id),
+        page, page_size, after_order,
+    )
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    tasks = await task_service.get_tasks_by_workflow(
+        db,
+        workflow_id,
+        skip=(page - 1) * page_size if page_size else 0,
+        limit=page_size,
+        after_order=after_order,
+    )
+    return etag_response(
+        request,
+        TaskListResponse(items=[TaskResponse.model_validate(t) for t in tasks]),
+        etag,
     )
 
 
@@ -110,9 +122,8 @@ async def create_task(
     db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new task in a workflow."""
-    # 获取当前最大 task_order
-    existing_tasks = await task_service.get_tasks_by_workflow(db, workflow_id)
-    next_order = len(existing_tasks) + 1
+    # 数据库中取 MAX(task_order) + 1，无需加载已有任务及其步骤
+    next_order = await task_service.get_next_task_order(db, workflow_id)
     
     task = await task_service.create_task(
         db,
@@ -143,6 +154,7 @@ async def get_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    # 单个任务只返回步骤数，steps 保持为空列表，与列表接口的完整步骤区分
     return TaskResponse(
         id=task.id,
         workflow_id=task.workflow_id,
@@ -202,7 +214,7 @@ async def reorder_tasks(
     db: AsyncSession = Depends(get_async_db),
 ):
     """Reorder tasks in a workflow."""
-    tasks = await task_service.reorder_tasks(db, workflow_id, data.task_ids)
+    rows = await task_service.reorder_tasks(db, workflow_id, data.task_ids)
     return TaskListResponse(
         items=[
             TaskResponse(
@@ -212,8 +224,8 @@ async def reorder_tasks(
                 task_order=t.task_order,
                 description=t.description,
                 status=t.status,
-                steps_count=len(t.steps) if t.steps else 0,
+                steps_count=steps_count,
             )
-            for t in tasks
+            for t, steps_count in rows
         ]
     )
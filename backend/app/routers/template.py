@@ -1,15 +1,19 @@
 """Template API router."""
 
+import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
+from app.core.etag import etag_response, make_etag, not_modified
 from app.services import template as template_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/templates", tags=["templates"])
 
 
@@ -22,6 +26,9 @@ class TemplateTaskInfo(BaseModel):
     name: str
     steps_count: int
 
+    class Config:
+        from_attributes = True
+
 
 class TemplateResponse(BaseModel):
     """Response schema for a template."""
@@ -60,57 +67,81 @@ class WorkflowCreatedResponse(BaseModel):
 
 @router.get("", response_model=TemplateListResponse)
 async def get_templates(
+    request: Request,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: Optional[int] = Query(
+        None, ge=1, le=200, description="Items per page (omit to return all templates)"
+    ),
     db: AsyncSession = Depends(get_async_db),
-):
-    """Get all available templates."""
-    from sqlalchemy import select, text
+) -> Response:
+    """Get available templates (with ETag / If-None-Match support).
+
+    不传 page_size 时返回全部模板，保持与未分页的调用方兼容。
+    """
+    from sqlalchemy import select
+    from sqlalchemy.orm import load_only, raiseload
     from app.models import Workflow, Task
     
     try:
-        # 简单查询，不使用 selectinload
+        # 先用行数与 max(updated_at) 组成 ETag，命中时不执行列表查询
+        etag = make_etag(
+            await template_service.get_templates_version(db), page, page_size
+        )
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+        
+        # 只取模板本身及列表展示用到的列，关闭关系上默认的 selectin 预加载
         result = await db.execute(
             select(Workflow)
+            .options(
+                load_only(
+                    Workflow.name,
+                    Workflow.description,
+                    Workflow.cover_image_url,
+                    raiseload=True,
+                ),
+                raiseload("*"),
+            )
             .where(Workflow.is_template == True)
-            .order_by(Workflow.created_at)
+            .order_by(Workflow.created_at, Workflow.id)
+            .offset((page - 1) * page_size if page_size else None)
+            .limit(page_size)
         )
         templates = list(result.scalars().all())
         
-        items = []
-        for t in templates:
-            # 单独查询 tasks
+        # 一次查询取所有模板的任务及其步骤数，替代逐模板、逐任务的查询
+        task_infos: dict[UUID, list[TemplateTaskInfo]] = {t.id: [] for t in templates}
+        if templates:
             tasks_result = await db.execute(
-                select(Task)
-                .where(Task.workflow_id == t.id)
-                .order_by(Task.task_order)
+                select(Task.workflow_id, Task.name, Task.steps_count)
+                .where(Task.workflow_id.in_(task_infos.keys()))
+                .order_by(Task.workflow_id, Task.task_order)
             )
-            tasks = list(tasks_result.scalars().all())
-            
-            task_infos = []
-            for task in tasks:
-                # 使用原始 SQL 获取 steps 数量
-                count_result = await db.execute(
-                    text("SELECT COUNT(*) FROM workflow_steps WHERE task_id = :task_id"),
-                    {"task_id": str(task.id)}
-                )
-                steps_count = count_result.scalar() or 0
-                task_infos.append(TemplateTaskInfo(
-                    name=task.name,
+            # 数据来自数据库、类型已确定，用 model_construct 跳过逐项校验；
+            # 序列化仍走各模型类定义时编译好的序列化器
+            for workflow_id, task_name, steps_count in tasks_result:
+                task_infos[workflow_id].append(TemplateTaskInfo.model_construct(
+                    name=task_name,
                     steps_count=steps_count,
                 ))
-            
-            items.append(TemplateResponse(
+        
+        items = [
+            TemplateResponse.model_construct(
                 id=t.id,
                 name=t.name,
                 description=t.description,
                 cover_image_url=t.cover_image_url,
-                tasks=task_infos,
-            ))
+                tasks=task_infos[t.id],
+            )
+            for t in templates
+        ]
         
-        return TemplateListResponse(items=items)
+        return etag_response(
+            request, TemplateListResponse.model_construct(items=items), etag
+        )
     except Exception as e:
-        import traceback
-        print(f"Error in get_templates: {e}")
-        print(traceback.format_exc())
+        logger.exception("get_templates failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -124,19 +155,7 @@ async def get_template(
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
     
-    return TemplateResponse(
-        id=template.id,
-        name=template.name,
-        description=template.description,
-        cover_image_url=template.cover_image_url,
-        tasks=[
-            TemplateTaskInfo(
-                name=task.name,
-                steps_count=len(task.steps) if task.steps else 0,
-            )
-            for task in (template.tasks or [])
-        ],
-    )
+    return TemplateResponse.model_validate(template)
 
 
 @router.post("/{template_id}/create", response_model=WorkflowCreatedResponse)
@@ -3,10 +3,11 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.etag import etag_response
 from app.schemas.workflow import (
     WorkflowCreate,
     WorkflowListResponse,
@@ -18,24 +19,28 @@ from app.services.workflow import WorkflowNotFoundError, WorkflowService
 router = APIRouter(prefix="/api/workflows", tags=["workflows"])
 
 
-def get_workflow_service(db: Session = Depends(get_db)) -> WorkflowService:
+def get_workflow_service(db: AsyncSession = Depends(get_async_db)) -> WorkflowService:
     """Dependency to get workflow service."""
     return WorkflowService(db)
 
 
 @router.get("", response_model=WorkflowListResponse)
 async def list_workflows(
+    request: Request,
     service: Annotated[WorkflowService, Depends(get_workflow_service)],
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> WorkflowListResponse:
+) -> Response:
     """
     List all workflows with pagination.
 
     - **page**: Page number (default: 1)
     - **page_size**: Number of items per page (default: 20, max: 100)
+
+    Responses carry an ETag; send it back in If-None-Match to get 304 when unchanged.
     """
-    return service.list_workflows(page=page, page_size=page_size)
+    result = await service.list_workflows(page=page, page_size=page_size)
+    return etag_response(request, result)
 
 
 @router.post("", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
@@ -51,7 +56,7 @@ async def create_workflow(
     - **cover_image_url**: Cover image URL (optional)
     - **status**: Workflow status, 'draft' or 'deployed' (default: 'draft')
     """
-    return service.create_workflow(data)
+    return await service.create_workflow(data)
 
 
 
@@ -66,7 +71,7 @@ async def get_workflow(
     - **workflow_id**: UUID of the workflow
     """
     try:
-        return service.get_workflow(workflow_id)
+        return await service.get_workflow(workflow_id)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -90,7 +95,7 @@ async def update_workflow(
     - **status**: New status (optional)
     """
     try:
-        return service.update_workflow(workflow_id, data)
+        return await service.update_workflow(workflow_id, data)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -109,7 +114,7 @@ async def delete_workflow(
     - **workflow_id**: UUID of the workflow
     """
     try:
-        service.delete_workflow(workflow_id)
+        await service.delete_workflow(workflow_id)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,6 @@
 """Pydantic Schemas for API request/response."""
 
-from app.schemas.base import BaseSchema, IDMixin, TimestampMixin
+from app.schemas.base import BaseSchema, FastORMMixin, IDMixin, TimestampMixin
 from app.schemas.protocol import (
     ProtocolFewShotExample,
     ProtocolInputSpec,
@@ -48,6 +48,7 @@ from app.schemas.workflow import (
 __all__ = [
     # Base
     "BaseSchema",
+    "FastORMMixin",
     "IDMixin",
     "TimestampMixin",
     # Workflow
@@ -1,6 +1,8 @@
 """Base Pydantic schemas and common types."""
 
 from datetime import datetime
+from functools import cache
+from typing import Any, get_args, get_origin
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -26,3 +28,37 @@ class IDMixin(BaseModel):
     """Mixin for ID field."""
 
     id: UUID
+
+
+class FastORMMixin:
+    """Build response models from trusted ORM objects without validation.
+
+    ORM 返回的数据类型已由数据库约束保证，from_orm_fast 直接按字段读取属性后
+    model_construct，省去 model_validate 的逐字段校验；list[子模型] 字段递归
+    使用子模型的 from_orm_fast。字段若新增 field_validator，需改回
+    model_validate，否则校验逻辑会被跳过。
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        values = {}
+        for name, nested in _construct_plan(cls):
+            value = getattr(obj, name)
+            if nested is not None:
+                value = [nested.from_orm_fast(item) for item in value]
+            values[name] = value
+        return cls.model_construct(**values)
+
+
+@cache
+def _construct_plan(model: type) -> tuple[tuple[str, Any], ...]:
+    # 每个模型只解析一次字段注解：(字段名, 嵌套模型或 None)
+    plan = []
+    for name, field in model.model_fields.items():
+        nested = None
+        if get_origin(field.annotation) is list:
+            (item_type,) = get_args(field.annotation)
+            if isinstance(item_type, type) and issubclass(item_type, FastORMMixin):
+                nested = item_type
+        plan.append((name, nested))
+    return tuple(plan)
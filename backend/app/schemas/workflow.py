@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.base import FastORMMixin
+
 
 # ============================================================================
 # Enums as Literal types
@@ -19,6 +21,10 @@ ContentType = Literal["image", "text"]
 ExampleLabel = Literal["PASS", "FAIL"]
 
 
+# 响应模型：由 ORM 对象构建后只读，冻结以防在服务层被意外修改
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
+
 # ============================================================================
 # RoutingBranch Schemas
 # ============================================================================
@@ -46,14 +52,14 @@ class RoutingBranchUpdate(BaseModel):
     next_step_id: Optional[str] = Field(None, max_length=100)
 
 
-class RoutingBranchResponse(RoutingBranchBase):
+class RoutingBranchResponse(FastORMMixin, RoutingBranchBase):
     """Schema for RoutingBranch response."""
 
     id: UUID
     step_id: UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 # ============================================================================
@@ -85,14 +91,14 @@ class ExampleUpdate(BaseModel):
     description: Optional[str] = None
 
 
-class ExampleResponse(ExampleBase):
+class ExampleResponse(FastORMMixin, ExampleBase):
     """Schema for Example response."""
 
     id: UUID
     step_id: UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 # ============================================================================
@@ -213,7 +219,7 @@ class WorkflowStepUpdate(BaseModel):
 
 
 
-class WorkflowStepResponse(WorkflowStepBase):
+class WorkflowStepResponse(FastORMMixin, WorkflowStepBase):
     """Schema for WorkflowStep response."""
 
     id: UUID
@@ -225,7 +231,7 @@ class WorkflowStepResponse(WorkflowStepBase):
     examples: list[ExampleResponse] = []
     routing_branches: list[RoutingBranchResponse] = []
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class WorkflowStepSummary(BaseModel):
@@ -239,7 +245,7 @@ class WorkflowStepSummary(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 # ============================================================================
@@ -271,7 +277,7 @@ class WorkflowUpdate(BaseModel):
     status: Optional[WorkflowStatus] = None
 
 
-class WorkflowResponse(WorkflowBase):
+class WorkflowResponse(FastORMMixin, WorkflowBase):
     """Schema for Workflow response with steps."""
 
     id: UUID
@@ -279,17 +285,17 @@ class WorkflowResponse(WorkflowBase):
     updated_at: datetime
     steps: list[WorkflowStepResponse] = []
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
-class WorkflowSummary(WorkflowBase):
+class WorkflowSummary(FastORMMixin, WorkflowBase):
     """Summary schema for Workflow (without nested steps)."""
 
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class WorkflowListResponse(BaseModel):
@@ -1,5 +1,8 @@
 """Service Layer."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from app.services.example import (
     ExampleNotFoundError,
     ExampleService,
@@ -10,6 +13,7 @@ from app.services.file import (
     FileUploadError,
     FileSizeExceededError,
     InvalidFileTypeError,
+    get_file_service,
 )
 from app.services.protocol import (
     ProtocolService,
@@ -24,17 +28,69 @@ from app.services.step import (
     WorkflowNotFoundError as StepWorkflowNotFoundError,
 )
 from app.services.workflow import WorkflowNotFoundError, WorkflowService
-from app.services.llm import LLMService, LLMServiceError, LLMConnectionError, LLMResponseError, get_llm_service
-from app.services.ai_analysis import (
-    AIAnalysisService,
-    AnalysisError,
-    AnalysisResult,
-    AnalysisResponse,
-    InsufficientExamplesError,
-    StepNotFoundError as AnalysisStepNotFoundError,
-)
-from app.services import task as task_service
-from app.services import note as note_service
+# 以下名称在首次访问时才导入对应子模块（PEP 562）：LLM 客户端、AI 分析等
+# 只有分析相关接口会用到，避免每个导入 app.services 的进程都加载 openai/httpx。
+# 值为 (模块路径, 属性名)，属性名为 None 表示导出模块本身
+_LAZY_IMPORTS = {
+    "LLMService": ("app.services.llm", "LLMService"),
+    "LLMServiceError": ("app.services.llm", "LLMServiceError"),
+    "LLMConnectionError": ("app.services.llm", "LLMConnectionError"),
+    "LLMResponseError": ("app.services.llm", "LLMResponseError"),
+    "get_llm_service": ("app.services.llm", "get_llm_service"),
+    "close_llm_service": ("app.services.llm", "close_llm_service"),
+    "AIAnalysisService": ("app.services.ai_analysis", "AIAnalysisService"),
+    "AnalysisError": ("app.services.ai_analysis", "AnalysisError"),
+    "AnalysisResult": ("app.services.ai_analysis", "AnalysisResult"),
+    "AnalysisResponse": ("app.services.ai_analysis", "AnalysisResponse"),
+    "InsufficientExamplesError": ("app.services.ai_analysis", "InsufficientExamplesError"),
+    "AnalysisStepNotFoundError": ("app.services.ai_analysis", "StepNotFoundError"),
+    "AnalysisJobResponse": ("app.services.analysis_job", "AnalysisJobResponse"),
+    "AnalysisJobQueueFullError": ("app.services.analysis_job", "AnalysisJobQueueFullError"),
+    "submit_analysis_job": ("app.services.analysis_job", "submit_analysis_job"),
+    "get_analysis_job": ("app.services.analysis_job", "get_analysis_job"),
+    "task_service": ("app.services.task", None),
+    "note_service": ("app.services.note", None),
+}
+
+if TYPE_CHECKING:
+    # 供类型检查器与 IDE 解析延迟导出的名称，运行时不执行
+    from app.services import note as note_service
+    from app.services import task as task_service
+    from app.services.ai_analysis import (
+        AIAnalysisService,
+        AnalysisError,
+        AnalysisResponse,
+        AnalysisResult,
+        InsufficientExamplesError,
+        StepNotFoundError as AnalysisStepNotFoundError,
+    )
+    from app.services.analysis_job import (
+        AnalysisJobQueueFullError,
+        AnalysisJobResponse,
+        get_analysis_job,
+        submit_analysis_job,
+    )
+    from app.services.llm import (
+        LLMConnectionError,
+        LLMResponseError,
+        LLMService,
+        LLMServiceError,
+        close_llm_service,
+        get_llm_service,
+    )
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    # 写回模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "WorkflowService",
@@ -51,6 +107,7 @@ __all__ = [
     "map_logic_strategy_to_protocol",
     "map_logic_strategy_from_protocol",
     "FileService",
+    "get_file_service",
     "FileUploadError",
     "FileSizeExceededError",
     "InvalidFileTypeError",
@@ -59,12 +116,17 @@ __all__ = [
     "LLMConnectionError",
     "LLMResponseError",
     "get_llm_service",
+    "close_llm_service",
     "AIAnalysisService",
     "AnalysisError",
     "AnalysisResult",
     "AnalysisResponse",
     "InsufficientExamplesError",
     "AnalysisStepNotFoundError",
+    "AnalysisJobResponse",
+    "AnalysisJobQueueFullError",
+    "submit_analysis_job",
+    "get_analysis_job",
     "task_service",
     "note_service",
 ]
@@ -8,11 +8,13 @@ Uses LLM to analyze user's step descriptions and uploaded materials to generate:
 
 import json
 import logging
-from typing import Optional
+import re
+from typing import Optional, Sequence
 from uuid import UUID
 
+import orjson
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import WorkflowStep
 from app.repositories.step import StepRepository
@@ -261,13 +263,123 @@ ANALYSIS_PROMPT_TEMPLATE = """你是一个"数据契约定义者"，负责将业
 4. **业务意图清晰** - 用一句话说清楚这一步要做什么
 """
 
+# _build_step_input 中前序输出上下文的固定首尾
+_CONTEXT_HEADER = (
+    "## 上下文：前序步骤的输出变量\n"
+    "你可以在定义本步骤的 inputs 时直接使用这些变量名：\n"
+)
+_CONTEXT_FOOTER = "\n**注意：本步骤的 inputs 如果来自前序步骤，必须使用上述变量名！**"
+
+# 素材条目前缀，按 note.content_type 区分；不在表中的类型不计入素材
+_NOTE_PREFIXES = {
+    "image": "- 📷 图片素材: ",
+    "voice": "- 🎤 语音转文字: ",
+    "text": "- 📝 文本材料:\n",
+    "video": "- 🎬 视频素材: ",
+}
+# 文本类素材写入 prompt 的最大字符数
+_MATERIAL_TEXT_LIMIT = 500
+
+
+def _truncate_material(text: str) -> str:
+    if len(text) > _MATERIAL_TEXT_LIMIT:
+        return f"{text[:_MATERIAL_TEXT_LIMIT]}..."
+    return text
+
+
+def _note_material(note) -> str:
+    if note.content_type == "voice":
+        # 语音：显示转文字结果
+        body = note.voice_transcript or "(语音未转文字)"
+    elif note.content_type == "text":
+        body = _truncate_material(note.content)
+    else:
+        body = note.content
+    return _NOTE_PREFIXES[note.content_type] + body
+
+
+def _example_to_str(val) -> Optional[str]:
+    """将 example 转换为字符串：列表、数字、布尔值等转为紧凑 JSON 字符串"""
+    if val is None or isinstance(val, str):
+        return val
+    return orjson.dumps(val).decode()
+
+
+def _build_data_field(field_data: dict) -> DataField:
+    """Build a DataField from one LLM contract entry.
+
+    LLM 输出的字段通常形状正确：各值类型都符合时用 model_construct 跳过校验；
+    否则走完整校验（类型转换，或抛出 ValidationError 交由调用方回退）。
+    """
+    values = {
+        "name": field_data.get("name", "unknown"),
+        "type": field_data.get("type", "string"),
+        "description": field_data.get("description", ""),
+        "required": field_data.get("required", True),
+        "example": _example_to_str(field_data.get("example")),
+    }
+    if (
+        isinstance(values["name"], str)
+        and isinstance(values["type"], str)
+        and isinstance(values["description"], str)
+        and isinstance(values["required"], bool)
+    ):
+        return DataField.model_construct(**values)
+    return DataField(**values)
+
+
+# LLM 响应中的 ```json ... ``` 或 ``` ... ``` 代码块，取其内容
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+# LLM 有时把 example 写成未转义的嵌套 JSON 或非字符串值，解析失败时替换为 null
+_EXAMPLE_FIX_RE = re.compile(
+    r'"example"\s*:\s*(?:"?\{[^}]+\}[^,\n]*|"?\[[^\]]+\][^,\n]*|\d+(?:\.\d+)?|true|false)'
+)
+
+
+def _load_analysis_json(raw_result: str) -> dict:
+    """Decode the LLM response, trying the cheapest shape first.
+
+    1. 整个响应就是 JSON（LLM 有时不加代码块）：一次 orjson.loads 即可
+    2. ```json ... ``` 代码块包裹：正则取出内容后解析
+    3. 仍失败：把 example 后的不合法值替换为 null 再解析
+
+    orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，调用方异常处理不变。
+    """
+    try:
+        data = orjson.loads(raw_result)
+        if isinstance(data, dict):
+            logger.debug("Parsed LLM response as bare JSON")
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    match = _JSON_BLOCK_RE.search(raw_result)
+    json_str = match.group(1) if match else raw_result.strip()
+    try:
+        data = orjson.loads(json_str)
+        logger.debug("Parsed LLM response from code block")
+        return data
+    except json.JSONDecodeError as e:
+        original_error = e
+
+    # 有时 LLM 会返回 "example": "{...}" 而不是 "example": {...}，
+    # 或者嵌套 JSON 字符串中的引号没有转义
+    fixed_json = _EXAMPLE_FIX_RE.sub('"example": null', json_str)
+    try:
+        data = orjson.loads(fixed_json)
+    except json.JSONDecodeError:
+        # 如果还是失败，抛出原始错误
+        raise original_error
+    logger.info("Fixed malformed JSON by removing problematic example values")
+    return data
+
 
 class AIAnalysisService:
     """Service for AI-powered step analysis."""
 
     def __init__(
         self,
-        db: Session,
+        db: AsyncSession,
         llm_service: Optional[LLMService] = None,
     ):
         """Initialize analysis service."""
@@ -275,7 +387,7 @@ class AIAnalysisService:
         self.step_repo = StepRepository(db)
         self.llm = llm_service or get_llm_service()
 
-    def analyze_step_examples(
+    async def analyze_step_examples(
         self, 
         step_id: UUID,
         previous_outputs: Optional[list[dict]] = None,
@@ -292,14 +404,14 @@ class AIAnalysisService:
             AnalysisResponse with analysis result
         """
         # Get step
-        step = self.step_repo.get_by_id(step_id)
+        step = await self.step_repo.get_by_id(step_id)
         if not step:
             raise StepNotFoundError(f"Step {step_id} not found")
 
-        # Build analysis input from step data (with context)
-        analysis_input = self._build_step_input(step, previous_outputs)
-        
-        # Check if there's anything to analyze
+        # notes 已由 StepRepository.get_by_id 预加载，只读取一次供下面复用
+        notes = getattr(step, "notes", None) or ()
+
+        # Check if there's anything to analyze（先于构建 prompt，空步骤直接返回）
         # 检查旧字段
         has_old_materials = bool(
             step.context_image_url or 
@@ -312,7 +424,7 @@ class AIAnalysisService:
         )
         # 检查新字段：整理备注和 notes
         has_expert_notes = bool(step.expert_notes)
-        has_notes = bool(hasattr(step, 'notes') and step.notes and len(step.notes) > 0)
+        has_notes = bool(notes)
         
         has_materials = has_old_materials or has_notes
         
@@ -337,9 +449,16 @@ class AIAnalysisService:
                 has_materials=False,
             )
         
-        # Call LLM
+        # Build analysis input from step data (with context)
+        analysis_input = self._build_step_input(step, previous_outputs, notes=notes)
+
+        # LLM 调用可能持续数十秒：先结束只读事务，把数据库连接归还连接池；
+        # 会话 expire_on_commit=False，已加载的步骤数据在提交后仍可直接使用
+        await self.db.commit()
+
+        # Call LLM（异步客户端，等待响应期间不阻塞事件循环）
         try:
-            raw_result = self.llm.analyze_text(
+            raw_result = await self.llm.aanalyze_text(
                 prompt=ANALYSIS_PROMPT_TEMPLATE,
                 content=analysis_input,
             )
@@ -356,36 +475,55 @@ class AIAnalysisService:
             )
 
         except LLMServiceError as e:
-            logger.error(f"LLM analysis failed: {e}")
+            logger.error("LLM analysis failed: %s", e)
             raise AnalysisError(f"AI analysis failed: {e}")
 
     def _build_step_input(
         self, 
         step: WorkflowStep,
         previous_outputs: Optional[list[dict]] = None,
+        notes: Optional[Sequence] = None,
     ) -> str:
-        """Build input text for LLM analysis from step data."""
+        """Build input text for LLM analysis from step data.
+
+        notes 为调用方已取出的 step.notes；未传入时从 step 读取。
+        """
+        if notes is None:
+            notes = getattr(step, "notes", None) or ()
+
+        # 常见情况：只有步骤名称和描述，直接拼出结果，不走下面的分段组装
+        description = step.context_description or step.logic_evaluation_prompt
+        if (
+            step.name
+            and description
+            and not previous_outputs
+            and not notes
+            and not step.expert_notes
+            and not step.context_image_url
+            and not step.context_text_content
+            and not step.context_voice_transcript
+        ):
+            return f"## 步骤名称\n{step.name}\n\n## 步骤描述\n{description}"
+
         parts = []
         
         # 上下文：前序步骤的输出（可用作本步骤的输入）
         if previous_outputs:
-            context_lines = ["## 上下文：前序步骤的输出变量"]
-            context_lines.append("你可以在定义本步骤的 inputs 时直接使用这些变量名：")
-            for output in previous_outputs:
-                name = output.get("name", "unknown")
-                dtype = output.get("type", "string")
-                desc = output.get("description", "")
-                context_lines.append(f"- `{name}` ({dtype}): {desc}")
-            context_lines.append("")
-            context_lines.append("**注意：本步骤的 inputs 如果来自前序步骤，必须使用上述变量名！**")
-            parts.append("\n".join(context_lines))
+            parts.append("".join([
+                _CONTEXT_HEADER,
+                *(
+                    f"- `{output.get('name', 'unknown')}` "
+                    f"({output.get('type', 'string')}): {output.get('description', '')}\n"
+                    for output in previous_outputs
+                ),
+                _CONTEXT_FOOTER,
+            ]))
         
         # Step name
         if step.name:
             parts.append(f"## 步骤名称\n{step.name}")
         
         # Step description (main content)
-        description = step.context_description or step.logic_evaluation_prompt
         if description:
             parts.append(f"## 步骤描述\n{description}")
         
@@ -394,22 +532,11 @@ class AIAnalysisService:
             parts.append(f"## 整理备注\n{step.expert_notes}")
         
         # Notes 素材（从 step_notes 表获取）
-        notes_materials = []
-        if hasattr(step, 'notes') and step.notes:
-            for note in step.notes:
-                if note.content_type == 'image':
-                    notes_materials.append(f"- 📷 图片素材: {note.content}")
-                elif note.content_type == 'voice':
-                    # 语音：显示转文字结果
-                    transcript = note.voice_transcript or "(语音未转文字)"
-                    notes_materials.append(f"- 🎤 语音转文字: {transcript}")
-                elif note.content_type == 'text':
-                    text = note.content
-                    if len(text) > 500:
-                        text = text[:500] + "..."
-                    notes_materials.append(f"- 📝 文本材料:\n{text}")
-                elif note.content_type == 'video':
-                    notes_materials.append(f"- 🎬 视频素材: {note.content}")
+        notes_materials = [
+            _note_material(note)
+            for note in notes
+            if note.content_type in _NOTE_PREFIXES
+        ]
         
         if notes_materials:
             parts.append("## 采集的素材\n" + "\n".join(notes_materials))
@@ -419,15 +546,13 @@ class AIAnalysisService:
         if step.context_image_url:
             old_materials.append(f"- 图片材料: {step.context_image_url}")
         if step.context_text_content:
-            text = step.context_text_content
-            if len(text) > 500:
-                text = text[:500] + "..."
-            old_materials.append(f"- 文本材料:\n{text}")
+            old_materials.append(
+                f"- 文本材料:\n{_truncate_material(step.context_text_content)}"
+            )
         if step.context_voice_transcript:
-            voice = step.context_voice_transcript
-            if len(voice) > 500:
-                voice = voice[:500] + "..."
-            old_materials.append(f"- 语音转写:\n{voice}")
+            old_materials.append(
+                f"- 语音转写:\n{_truncate_material(step.context_voice_transcript)}"
+            )
         
         if old_materials:
             parts.append("## 参考材料\n" + "\n".join(old_materials))
@@ -437,73 +562,22 @@ class AIAnalysisService:
     def _parse_analysis_result(self, raw_result: str) -> AnalysisResult:
         """Parse LLM response into AnalysisResult (数据契约)."""
         try:
-            # Extract JSON from response
-            if "```json" in raw_result:
-                start = raw_result.find("```json") + 7
-                end = raw_result.find("```", start)
-                json_str = raw_result[start:end].strip()
-            elif "```" in raw_result:
-                start = raw_result.find("```") + 3
-                end = raw_result.find("```", start)
-                json_str = raw_result[start:end].strip()
-            else:
-                json_str = raw_result.strip()
-            
-            # 预处理：修复 LLM 生成的格式错误
-            # 有时 LLM 会返回 "example": "{...}" 而不是 "example": {...}
-            # 或者嵌套 JSON 字符串中的引号没有转义
-            import re
-            
-            # 尝试直接解析，如果失败则尝试修复
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError:
-                # 尝试修复常见问题：将 "example": 后的不合法值替换为 null
-                fixed_json = re.sub(
-                    r'"example"\s*:\s*(?:"?\{[^}]+\}[^,\n]*|"?\[[^\]]+\][^,\n]*|\d+(?:\.\d+)?|true|false)',
-                    '"example": null',
-                    json_str
-                )
-                try:
-                    data = json.loads(fixed_json)
-                    logger.info("Fixed malformed JSON by removing problematic example values")
-                except json.JSONDecodeError:
-                    # 如果还是失败，抛出原始错误
-                    data = json.loads(json_str)
+            data = _load_analysis_json(raw_result)
             
             # Parse contract
             contract_data = data.get("contract", {})
             
-            # 辅助函数：将 example 转换为字符串
-            def to_str_example(val):
-                if val is None:
-                    return None
-                if isinstance(val, str):
-                    return val
-                # 列表、数字、布尔值等转为 JSON 字符串
-                return json.dumps(val, ensure_ascii=False)
-            
             # Parse inputs
-            inputs = []
-            for field_data in contract_data.get("inputs", []):
-                inputs.append(DataField(
-                    name=field_data.get("name", "unknown"),
-                    type=field_data.get("type", "string"),
-                    description=field_data.get("description", ""),
-                    required=field_data.get("required", True),
-                    example=to_str_example(field_data.get("example")),
-                ))
+            inputs = [
+                _build_data_field(field_data)
+                for field_data in contract_data.get("inputs", [])
+            ]
             
             # Parse outputs
-            outputs = []
-            for field_data in contract_data.get("outputs", []):
-                outputs.append(DataField(
-                    name=field_data.get("name", "unknown"),
-                    type=field_data.get("type", "string"),
-                    description=field_data.get("description", ""),
-                    required=field_data.get("required", True),
-                    example=to_str_example(field_data.get("example")),
-                ))
+            outputs = [
+                _build_data_field(field_data)
+                for field_data in contract_data.get("outputs", [])
+            ]
             
             contract = StepContract(
                 step_id=int(contract_data.get("step_id", 1)),
@@ -521,7 +595,7 @@ class AIAnalysisService:
             )
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.warning(f"Failed to parse LLM response as JSON: {e}")
+            logger.warning("Failed to parse LLM response as JSON: %s", e)
             # Return a fallback result
             return AnalysisResult(
                 contract=StepContract(
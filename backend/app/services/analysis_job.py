@@ -0,0 +1,136 @@
+"""Background analysis jobs.
+
+分析调用 LLM 可能持续数十秒甚至数分钟；提交后立即返回 job_id，
+由客户端轮询结果，避免 HTTP 连接与请求会话在整个 LLM 往返期间被占用。
+任务状态保存在进程内，仅对提交它的 worker 可见。
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Literal, Optional
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+
+from app.core.database import AsyncSessionLocal
+from app.services.ai_analysis import (
+    AIAnalysisService,
+    AnalysisError,
+    AnalysisResponse,
+    InsufficientExamplesError,
+    StepNotFoundError,
+)
+from app.services.llm import get_llm_service
+
+logger = logging.getLogger(__name__)
+
+AnalysisJobState = Literal["pending", "done", "error"]
+
+# 最多保留的任务数；超出时淘汰最早提交且已结束的任务，
+# 全部仍在进行时拒绝新的提交
+MAX_ANALYSIS_JOBS = 1000
+# 同时进行的 LLM 分析数，其余任务排队等待
+MAX_CONCURRENT_ANALYSES = 4
+
+
+class AnalysisJobQueueFullError(Exception):
+    """Raised when too many analysis jobs are still pending."""
+    pass
+
+
+class AnalysisJobResponse(BaseModel):
+    """后台分析任务状态"""
+    job_id: UUID
+    step_id: UUID
+    state: AnalysisJobState = "pending"
+    result: Optional[AnalysisResponse] = None
+    error: Optional[str] = None
+
+
+_jobs: "OrderedDict[UUID, AnalysisJobResponse]" = OrderedDict()
+# 持有运行中 asyncio.Task 的强引用，防止被垃圾回收
+_running: dict[UUID, asyncio.Task] = {}
+_slots = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+
+def submit_analysis_job(
+    step_id: UUID,
+    previous_outputs: Optional[list[dict]] = None,
+) -> AnalysisJobResponse:
+    """
+    Schedule analysis of a step in the background.
+
+    Args:
+        step_id: UUID of the step
+        previous_outputs: 前序步骤的输出变量列表
+
+    Returns:
+        The pending job
+
+    Raises:
+        AnalysisJobQueueFullError: If MAX_ANALYSIS_JOBS jobs are all still pending
+    """
+    _evict_finished_jobs()
+    if len(_jobs) >= MAX_ANALYSIS_JOBS:
+        raise AnalysisJobQueueFullError(
+            f"Too many pending analysis jobs (limit {MAX_ANALYSIS_JOBS})"
+        )
+    job = AnalysisJobResponse(job_id=uuid4(), step_id=step_id)
+    _jobs[job.job_id] = job
+
+    task = asyncio.create_task(_run_analysis_job(job, previous_outputs))
+    _running[job.job_id] = task
+    task.add_done_callback(lambda _: _running.pop(job.job_id, None))
+    return job
+
+
+def get_analysis_job(job_id: UUID) -> Optional[AnalysisJobResponse]:
+    """Get a job by ID, return None if unknown or evicted."""
+    return _jobs.get(job_id)
+
+
+async def cancel_analysis_jobs() -> None:
+    """Cancel all running jobs (called on application shutdown)."""
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _run_analysis_job(
+    job: AnalysisJobResponse,
+    previous_outputs: Optional[list[dict]],
+) -> None:
+    # 请求会话在返回 202 后即关闭，后台任务使用独立会话；
+    # 拿到并发名额后才打开会话，排队期间不占用数据库连接
+    try:
+        async with _slots:
+            async with AsyncSessionLocal() as db:
+                service = AIAnalysisService(db, get_llm_service())
+                job.result = await service.analyze_step_examples(
+                    job.step_id, previous_outputs
+                )
+        job.state = "done"
+    except (StepNotFoundError, InsufficientExamplesError, AnalysisError) as e:
+        job.error = str(e)
+        job.state = "error"
+    except asyncio.CancelledError:
+        job.error = "Analysis cancelled"
+        job.state = "error"
+        raise
+    except Exception:
+        logger.exception("Analysis job %s failed", job.job_id)
+        job.error = "Analysis failed"
+        job.state = "error"
+
+
+def _evict_finished_jobs() -> None:
+    if len(_jobs) < MAX_ANALYSIS_JOBS:
+        return
+    for job_id in [
+        job_id for job_id, job in _jobs.items() if job.state != "pending"
+    ]:
+        del _jobs[job_id]
+        if len(_jobs) < MAX_ANALYSIS_JOBS:
+            break
@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import Example
 from app.repositories.example import ExampleRepository
@@ -15,6 +15,10 @@ from app.schemas.workflow import (
 )
 
 
+# 批量创建时每次 flush 的行数，控制单条多行 INSERT 语句的大小
+EXAMPLE_BATCH_SIZE = 200
+
+
 class ExampleNotFoundError(Exception):
     """Raised when an example is not found."""
 
@@ -34,13 +38,13 @@ class StepNotFoundError(Exception):
 class ExampleService:
     """Service for example business logic."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service with database session."""
         self.db = db
         self.repository = ExampleRepository(db)
         self.step_repository = StepRepository(db)
 
-    def create_example(
+    async def create_example(
         self,
         step_id: UUID,
         data: ExampleCreate,
@@ -52,7 +56,7 @@ class ExampleService:
         ensuring correct labeling based on upload zone.
         """
         # Verify step exists
-        if not self.step_repository.exists(step_id):
+        if not await self.step_repository.exists(step_id):
             raise StepNotFoundError(step_id)
 
         example = Example(
@@ -62,89 +66,125 @@ class ExampleService:
             label=data.label,
             description=data.description,
         )
-        created = self.repository.create(example)
-        return ExampleResponse.model_validate(created)
+        created = await self.repository.create(example)
+        response = ExampleResponse.from_orm_fast(created)
+        await self.db.commit()
+        return response
+
+    async def create_examples(
+        self,
+        step_id: UUID,
+        data: list[ExampleCreate],
+    ) -> list[ExampleResponse]:
+        """
+        Create multiple examples for a step in one transaction.
+
+        步骤只校验一次；每 EXAMPLE_BATCH_SIZE 行 flush 一次，
+        主键在 Python 侧生成，单次 flush 合并为一条多行 INSERT ... RETURNING。
+        """
+        if not await self.step_repository.exists(step_id):
+            raise StepNotFoundError(step_id)
 
-    def get_example(self, example_id: UUID) -> ExampleResponse:
+        created: list[Example] = []
+        for start in range(0, len(data), EXAMPLE_BATCH_SIZE):
+            batch = [
+                Example(
+                    step_id=step_id,
+                    content=item.content,
+                    content_type=item.content_type,
+                    label=item.label,
+                    description=item.description,
+                )
+                for item in data[start:start + EXAMPLE_BATCH_SIZE]
+            ]
+            created.extend(await self.repository.bulk_create(batch))
+
+        response = [ExampleResponse.from_orm_fast(e) for e in created]
+        await self.db.commit()
+        return response
+
+    async def get_example(self, example_id: UUID) -> ExampleResponse:
         """Get an example by ID."""
-        example = self.repository.get_by_id(example_id)
+        example = await self.repository.get_by_id(example_id)
         if not example:
             raise ExampleNotFoundError(example_id)
-        return ExampleResponse.model_validate(example)
+        return ExampleResponse.from_orm_fast(example)
 
-    def get_example_or_none(self, example_id: UUID) -> Optional[ExampleResponse]:
+    async def get_example_or_none(self, example_id: UUID) -> Optional[ExampleResponse]:
         """Get an example by ID, return None if not found."""
-        example = self.repository.get_by_id(example_id)
+        example = await self.repository.get_by_id(example_id)
         if not example:
             return None
-        return ExampleResponse.model_validate(example)
+        return ExampleResponse.from_orm_fast(example)
 
-    def list_examples_by_step(self, step_id: UUID) -> list[ExampleResponse]:
+    async def list_examples_by_step(self, step_id: UUID) -> list[ExampleResponse]:
         """List all examples for a step."""
-        # Verify step exists
-        if not self.step_repository.exists(step_id):
-            raise StepNotFoundError(step_id)
-
-        examples = self.repository.get_by_step_id(step_id)
-        return [ExampleResponse.model_validate(e) for e in examples]
+        examples = await self.repository.get_by_step_id(step_id)
+        await self._require_step_if_empty(step_id, not examples)
+        return [ExampleResponse.from_orm_fast(e) for e in examples]
 
-    def list_passing_examples(self, step_id: UUID) -> list[ExampleResponse]:
+    async def list_passing_examples(self, step_id: UUID) -> list[ExampleResponse]:
         """List all passing examples for a step."""
-        if not self.step_repository.exists(step_id):
-            raise StepNotFoundError(step_id)
-
-        examples = self.repository.get_by_step_id_and_label(step_id, "PASS")
-        return [ExampleResponse.model_validate(e) for e in examples]
+        examples = await self.repository.get_by_step_id_and_label(step_id, "PASS")
+        await self._require_step_if_empty(step_id, not examples)
+        return [ExampleResponse.from_orm_fast(e) for e in examples]
 
-    def list_failing_examples(self, step_id: UUID) -> list[ExampleResponse]:
+    async def list_failing_examples(self, step_id: UUID) -> list[ExampleResponse]:
         """List all failing examples for a step."""
-        if not self.step_repository.exists(step_id):
-            raise StepNotFoundError(step_id)
-
-        examples = self.repository.get_by_step_id_and_label(step_id, "FAIL")
-        return [ExampleResponse.model_validate(e) for e in examples]
+        examples = await self.repository.get_by_step_id_and_label(step_id, "FAIL")
+        await self._require_step_if_empty(step_id, not examples)
+        return [ExampleResponse.from_orm_fast(e) for e in examples]
 
 
-    def update_example(
+    async def update_example(
         self,
         example_id: UUID,
         data: ExampleUpdate,
     ) -> ExampleResponse:
         """Update an example."""
-        example = self.repository.get_by_id(example_id)
+        example = await self.repository.get_by_id(example_id)
         if not example:
             raise ExampleNotFoundError(example_id)
 
         update_data = data.model_dump(exclude_unset=True)
-        updated = self.repository.update(example, update_data)
-        return ExampleResponse.model_validate(updated)
+        updated = await self.repository.update(example, update_data)
+        response = ExampleResponse.from_orm_fast(updated)
+        await self.db.commit()
+        return response
 
-    def delete_example(self, example_id: UUID) -> None:
+    async def delete_example(self, example_id: UUID) -> None:
         """Delete an example."""
-        example = self.repository.get_by_id(example_id)
+        example = await self.repository.get_by_id(example_id)
         if not example:
             raise ExampleNotFoundError(example_id)
 
-        self.repository.delete(example)
+        await self.repository.delete(example)
+        await self.db.commit()
 
-    def example_exists(self, example_id: UUID) -> bool:
+    async def example_exists(self, example_id: UUID) -> bool:
         """Check if an example exists."""
-        return self.repository.exists(example_id)
+        return await self.repository.exists(example_id)
 
-    def count_examples(self, step_id: UUID) -> int:
+    async def count_examples(self, step_id: UUID) -> int:
         """Count examples for a step."""
-        if not self.step_repository.exists(step_id):
-            raise StepNotFoundError(step_id)
-        return self.repository.count_by_step_id(step_id)
+        count = await self.repository.count_by_step_id(step_id)
+        await self._require_step_if_empty(step_id, count == 0)
+        return count
 
-    def count_passing_examples(self, step_id: UUID) -> int:
+    async def count_passing_examples(self, step_id: UUID) -> int:
         """Count passing examples for a step."""
-        if not self.step_repository.exists(step_id):
-            raise StepNotFoundError(step_id)
-        return self.repository.count_by_step_id_and_label(step_id, "PASS")
+        count = await self.repository.count_by_step_id_and_label(step_id, "PASS")
+        await self._require_step_if_empty(step_id, count == 0)
+        return count
 
-    def count_failing_examples(self, step_id: UUID) -> int:
+    async def count_failing_examples(self, step_id: UUID) -> int:
         """Count failing examples for a step."""
-        if not self.step_repository.exists(step_id):
+        count = await self.repository.count_by_step_id_and_label(step_id, "FAIL")
+        await self._require_step_if_empty(step_id, count == 0)
+        return count
+
+    async def _require_step_if_empty(self, step_id: UUID, empty: bool) -> None:
+        # 查到示例时外键已保证步骤存在；只有结果为空才需要再查一次，
+        # 区分“步骤下没有示例”和“步骤不存在”
+        if empty and not await self.step_repository.exists(step_id):
             raise StepNotFoundError(step_id)
-        return self.repository.count_by_step_id_and_label(step_id, "FAIL")
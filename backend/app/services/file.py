@@ -1,14 +1,20 @@
 """File upload service for handling image uploads."""
 
+import asyncio
 import os
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import aiofiles
+from fastapi import UploadFile
 
 from app.core.config import get_settings
 
+# 流式写入时每次读取的块大小
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class FileUploadError(Exception):
     """Raised when file upload fails."""
@@ -39,11 +45,16 @@ class FileService:
         "image/webp",
         "image/bmp",
     }
+    # 拒绝上传时的提示文本，类加载时拼好一次
+    _ALLOWED_EXTENSIONS_TEXT = ", ".join(sorted(ALLOWED_EXTENSIONS))
+    _ALLOWED_CONTENT_TYPES_TEXT = ", ".join(sorted(ALLOWED_CONTENT_TYPES))
 
     def __init__(self):
         """Initialize file service."""
         self.settings = get_settings()
         self.upload_dir = Path(self.settings.upload_dir)
+        # URL -> 路径的查找走 os.path 字符串运算，不再逐次构造 Path 对象
+        self._upload_dir_str = str(self.upload_dir)
         self._ensure_upload_dir()
 
     def _ensure_upload_dir(self) -> None:
@@ -66,7 +77,7 @@ class FileService:
         if ext not in self.ALLOWED_EXTENSIONS:
             raise InvalidFileTypeError(
                 f"File type '{ext}' is not allowed. "
-                f"Allowed types: {', '.join(self.ALLOWED_EXTENSIONS)}"
+                f"Allowed types: {self._ALLOWED_EXTENSIONS_TEXT}"
             )
         return ext
 
@@ -82,7 +93,7 @@ class FileService:
         if content_type and content_type not in self.ALLOWED_CONTENT_TYPES:
             raise InvalidFileTypeError(
                 f"Content type '{content_type}' is not allowed. "
-                f"Allowed types: {', '.join(self.ALLOWED_CONTENT_TYPES)}"
+                f"Allowed types: {self._ALLOWED_CONTENT_TYPES_TEXT}"
             )
 
     def _validate_file_size(self, size: int) -> None:
@@ -95,37 +106,32 @@ class FileService:
             FileSizeExceededError: If file size exceeds maximum
         """
         if size > self.settings.max_upload_size:
-            max_mb = self.settings.max_upload_size / (1024 * 1024)
             raise FileSizeExceededError(
-                f"File size exceeds maximum allowed size of {max_mb:.1f}MB"
+                "File size exceeds maximum allowed size of "
+                f"{self.settings.max_upload_size_mb:.1f}MB"
             )
 
-    def _generate_unique_filename(self, original_filename: str) -> str:
+    def _generate_unique_filename(self, ext: str) -> str:
         """Generate a unique filename.
 
         Args:
-            original_filename: Original filename
+            ext: Validated file extension (lowercase, with leading dot)
 
         Returns:
             Unique filename with timestamp and UUID
         """
-        ext = Path(original_filename).suffix.lower()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         unique_id = uuid.uuid4().hex[:8]
         return f"{timestamp}_{unique_id}{ext}"
 
-    async def upload_file(
-        self,
-        file_content: bytes,
-        filename: str,
-        content_type: str | None = None,
-    ) -> str:
+    async def upload_file(self, file: UploadFile) -> str:
         """Upload a file and return its URL.
 
+        按块从上传流读取并写入磁盘，不在内存中拼接整个文件；
+        累计大小超过上限时立即中止并清理已写入的部分。
+
         Args:
-            file_content: File content as bytes
-            filename: Original filename
-            content_type: MIME type of the file
+            file: Uploaded file (filename and content_type are taken from it)
 
         Returns:
             URL path to access the uploaded file (e.g., /uploads/xxx.jpg)
@@ -135,23 +141,44 @@ class FileService:
             FileSizeExceededError: If file size exceeds maximum
             FileUploadError: If upload fails
         """
+        filename = file.filename or ""
+
         # Validate file
-        self._validate_file_extension(filename)
-        self._validate_content_type(content_type)
-        self._validate_file_size(len(file_content))
+        ext = self._validate_file_extension(filename)
+        self._validate_content_type(file.content_type)
+        # 客户端声明了大小时提前拒绝，无需读取内容
+        if file.size is not None:
+            self._validate_file_size(file.size)
 
         # Generate unique filename
-        unique_filename = self._generate_unique_filename(filename)
+        unique_filename = self._generate_unique_filename(ext)
         file_path = self.upload_dir / unique_filename
 
         try:
-            # Write file asynchronously
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            self._validate_file_size(len(chunk))
+            following = await file.read(UPLOAD_CHUNK_SIZE)
+            if not following:
+                # 常见的图片一个块即可读完：一次线程调度完成打开、写入与关闭
+                await asyncio.to_thread(file_path.write_bytes, chunk)
+            else:
+                # Stream file to disk asynchronously
+                written = len(chunk)
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(chunk)
+                    while following:
+                        written += len(following)
+                        self._validate_file_size(written)
+                        await f.write(following)
+                        following = await file.read(UPLOAD_CHUNK_SIZE)
 
             # Return URL path
             return f"/uploads/{unique_filename}"
 
+        except FileSizeExceededError:
+            if file_path.exists():
+                file_path.unlink()
+            raise
         except Exception as e:
             # Clean up partial file if exists
             if file_path.exists():
@@ -167,18 +194,11 @@ class FileService:
         Returns:
             True if file was deleted, False if file didn't exist
         """
-        # Extract filename from URL
-        if file_url.startswith("/uploads/"):
-            filename = file_url[len("/uploads/"):]
-        else:
-            filename = file_url
-
-        file_path = self.upload_dir / filename
-
-        if file_path.exists():
-            file_path.unlink()
-            return True
-        return False
+        try:
+            os.unlink(self._upload_path(file_url))
+        except FileNotFoundError:
+            return False
+        return True
 
     def get_file_path(self, file_url: str) -> Path | None:
         """Get the full file path from URL.
@@ -189,13 +209,27 @@ class FileService:
         Returns:
             Full file path or None if file doesn't exist
         """
+        file_path = self._upload_path(file_url)
+        if os.path.exists(file_path):
+            return Path(file_path)
+        return None
+
+    def _upload_path(self, file_url: str) -> str:
+        # Extract filename from URL
         if file_url.startswith("/uploads/"):
             filename = file_url[len("/uploads/"):]
         else:
             filename = file_url
+        return os.path.join(self._upload_dir_str, filename)
 
-        file_path = self.upload_dir / filename
 
-        if file_path.exists():
-            return file_path
-        return None
+# Singleton instance
+_file_service: Optional[FileService] = None
+
+
+def get_file_service() -> FileService:
+    """Get or create file service singleton."""
+    global _file_service
+    if _file_service is None:
+        _file_service = FileService()
+    return _file_service
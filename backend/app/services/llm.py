@@ -9,12 +9,20 @@ Supports OpenAI-compatible APIs including:
 import logging
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+from openai import APIConnectionError, AsyncOpenAI
 
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 上游连接池：复用 TCP/TLS 连接，省去每次调用的握手；
+# 生成长文本可能持续数分钟，读超时保持宽松，只收紧建连超时
+LLM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+LLM_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+# 连接失败、超时、429 与 5xx 由 OpenAI 客户端按指数退避自动重试，最多共 3 次请求
+LLM_MAX_RETRIES = 2
+
 
 class LLMServiceError(Exception):
     """Base exception for LLM service errors."""
@@ -62,10 +70,15 @@ class LLMService:
         self.model = model or settings.llm_model
         self.enabled = settings.llm_enabled
         
-        # Initialize OpenAI client with custom base URL
-        self.client = OpenAI(
+        # 异步客户端供 FastAPI 请求与后台任务使用，等待 LLM 时不占用线程
+        self.async_client = AsyncOpenAI(
             api_key=self.api_key or "dummy-key",  # Some local deployments don't need key
             base_url=self.api_base,
+            max_retries=LLM_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                limits=LLM_HTTP_LIMITS,
+                timeout=LLM_HTTP_TIMEOUT,
+            ),
         )
         
         logger.info(
@@ -77,7 +90,7 @@ class LLMService:
         """Check if LLM service is enabled."""
         return self.enabled
 
-    def chat(
+    async def achat(
         self,
         messages: list[dict],
         temperature: float = 0.7,
@@ -98,58 +111,69 @@ class LLMService:
             LLMConnectionError: If connection fails
             LLMResponseError: If response is invalid
         """
-        if not self.enabled:
-            raise LLMServiceError("LLM service is disabled")
-
-        # 打印请求数据
-        print("=" * 60)
-        print("LLM REQUEST")
-        print(f"Model: {self.model}")
-        print(f"Temperature: {temperature}, Max Tokens: {max_tokens}")
-        for i, msg in enumerate(messages):
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            # 截断过长内容避免日志过大
-            if len(content) > 500:
-                content = content[:500] + "... (truncated)"
-            print(f"Message[{i}] ({role}): {content}")
-        print("=" * 60)
-
+        self._before_request(messages, temperature, max_tokens)
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
-            
-            if not response.choices:
-                raise LLMResponseError("No choices in LLM response")
-            
-            content = response.choices[0].message.content
-            if content is None:
-                raise LLMResponseError("Empty content in LLM response")
-            
-            # 打印响应数据
-            print("=" * 60)
-            print("LLM RESPONSE")
-            print(
-                f"Tokens: {response.usage.total_tokens if response.usage else 'unknown'} "
-                f"(prompt={response.usage.prompt_tokens if response.usage else '?'}, "
-                f"completion={response.usage.completion_tokens if response.usage else '?'})"
+            return self._response_content(response)
+        except Exception as e:
+            raise self._wrap_error(e)
+
+    def _before_request(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> None:
+        if not self.enabled:
+            raise LLMServiceError("LLM service is disabled")
+
+        # 请求内容只在 DEBUG 级别输出；未开启时跳过截断与格式化
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "LLM request model=%s temperature=%s max_tokens=%s messages=%d",
+                self.model, temperature, max_tokens, len(messages),
             )
-            # 打印完整响应内容
-            print(f"Content:\n{content}")
-            print("=" * 60)
-            
-            return content
+            for i, msg in enumerate(messages):
+                content = msg.get("content", "")
+                # 截断过长内容避免日志过大
+                if len(content) > 500:
+                    content = content[:500] + "... (truncated)"
+                logger.debug("Message[%d] (%s): %s", i, msg.get("role", "unknown"), content)
+
+    @staticmethod
+    def _response_content(response) -> str:
+        if not response.choices:
+            raise LLMResponseError("No choices in LLM response")
+        
+        content = response.choices[0].message.content
+        if content is None:
+            raise LLMResponseError("Empty content in LLM response")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            usage = response.usage
+            logger.debug(
+                "LLM response tokens=%s (prompt=%s, completion=%s)\n%s",
+                usage.total_tokens if usage else "unknown",
+                usage.prompt_tokens if usage else "?",
+                usage.completion_tokens if usage else "?",
+                content,
+            )
+        
+        return content
 
-        except Exception as e:
-            if "Connection" in str(e) or "connect" in str(e).lower():
-                raise LLMConnectionError(f"Failed to connect to LLM API: {e}")
-            raise LLMResponseError(f"LLM request failed: {e}")
+    @staticmethod
+    def _wrap_error(e: Exception) -> LLMServiceError:
+        # APITimeoutError 是 APIConnectionError 的子类
+        if isinstance(e, APIConnectionError):
+            return LLMConnectionError(f"Failed to connect to LLM API: {e}")
+        return LLMResponseError(f"LLM request failed: {e}")
 
-    def analyze_text(self, prompt: str, content: str) -> str:
+    async def aanalyze_text(self, prompt: str, content: str) -> str:
         """
         Analyze text content with LLM.
         
@@ -164,36 +188,7 @@ class LLMService:
             {"role": "system", "content": prompt},
             {"role": "user", "content": content},
         ]
-        return self.chat(messages)
-
-    def analyze_with_examples(
-        self,
-        system_prompt: str,
-        examples: list[dict],
-        query: str,
-    ) -> str:
-        """
-        Analyze with few-shot examples.
-        
-        Args:
-            system_prompt: System instruction
-            examples: List of example dicts with 'input' and 'output'
-            query: Query to analyze
-            
-        Returns:
-            Analysis result
-        """
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add examples as assistant/user turns
-        for example in examples:
-            messages.append({"role": "user", "content": example["input"]})
-            messages.append({"role": "assistant", "content": example["output"]})
-        
-        # Add the actual query
-        messages.append({"role": "user", "content": query})
-        
-        return self.chat(messages)
+        return await self.achat(messages)
 
 
 # Singleton instance
@@ -206,3 +201,14 @@ def get_llm_service() -> LLMService:
     if _llm_service is None:
         _llm_service = LLMService()
     return _llm_service
+
+
+async def close_llm_service() -> None:
+    """Close the shared LLM client and drop the singleton.
+
+    在应用关闭时调用，释放底层 HTTP 连接池。
+    """
+    global _llm_service
+    if _llm_service is not None:
+        await _llm_service.async_client.close()
+        _llm_service = None
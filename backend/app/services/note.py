@@ -1,9 +1,10 @@
 """StepNote service for managing step notes/media."""
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import StepNote
@@ -22,6 +23,27 @@ async def get_notes_by_step(
     return list(result.scalars().all())
 
 
+async def get_notes_by_steps(
+    db: AsyncSession,
+    step_ids: List[UUID],
+) -> Dict[UUID, List[StepNote]]:
+    """Get notes for multiple steps in one query, grouped by step_id.
+
+    每个请求的 step_id 都会出现在结果中（没有笔记时为空列表）。
+    """
+    grouped: Dict[UUID, List[StepNote]] = defaultdict(list)
+    if not step_ids:
+        return grouped
+    result = await db.execute(
+        select(StepNote)
+        .where(StepNote.step_id.in_(step_ids))
+        .order_by(StepNote.created_at)
+    )
+    for note in result.scalars():
+        grouped[note.step_id].append(note)
+    return {step_id: grouped[step_id] for step_id in step_ids}
+
+
 async def get_note_by_id(
     db: AsyncSession,
     note_id: UUID,
@@ -96,6 +118,6 @@ async def get_notes_count_by_step(
 ) -> int:
     """Get the count of notes for a step."""
     result = await db.execute(
-        select(StepNote).where(StepNote.step_id == step_id)
+        select(func.count()).select_from(StepNote).where(StepNote.step_id == step_id)
     )
-    return len(list(result.scalars().all()))
+    return result.scalar_one()
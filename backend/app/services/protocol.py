@@ -3,7 +3,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import Example, RoutingBranch, Workflow, WorkflowStep
 from app.repositories.workflow import WorkflowRepository
@@ -20,6 +21,10 @@ from app.schemas.protocol import (
 )
 
 
+# 整个示例列表交给 pydantic-core 一次校验，不逐条构造模型
+_FEW_SHOT_EXAMPLES_ADAPTER = TypeAdapter(list[ProtocolFewShotExample])
+
+
 # ============================================================================
 # Logic Strategy Mapping
 # ============================================================================
@@ -83,11 +88,11 @@ class WorkflowNotFoundError(Exception):
 class ProtocolService:
     """Service for generating Protocol JSON from workflows."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service with database session."""
         self.repository = WorkflowRepository(db)
 
-    def generate_protocol(self, workflow_id: UUID) -> ProtocolWorkflow:
+    async def generate_protocol(self, workflow_id: UUID) -> ProtocolWorkflow:
         """Generate Protocol JSON from a workflow.
         
         Args:
@@ -99,7 +104,7 @@ class ProtocolService:
         Raises:
             WorkflowNotFoundError: If the workflow is not found
         """
-        workflow = self.repository.get_by_id(workflow_id)
+        workflow = await self.repository.get_for_protocol(workflow_id)
         if not workflow:
             raise WorkflowNotFoundError(workflow_id)
         
@@ -210,10 +215,7 @@ class ProtocolService:
         # 构建 few_shot_examples (如果使用 few_shot 策略)
         few_shot_examples = None
         if step.logic_strategy == "few_shot" and step.examples:
-            few_shot_examples = [
-                self._convert_example_to_protocol(example)
-                for example in step.examples
-            ]
+            few_shot_examples = self._convert_examples_to_protocol(step.examples)
         
         return ProtocolLogicConfig(
             logic_strategy=logic_strategy,  # type: ignore
@@ -222,20 +224,25 @@ class ProtocolService:
             evaluation_prompt=step.logic_evaluation_prompt,
         )
 
-    def _convert_example_to_protocol(self, example: Example) -> ProtocolFewShotExample:
-        """Convert an Example model to ProtocolFewShotExample schema.
+    def _convert_examples_to_protocol(
+        self, examples: list[Example]
+    ) -> list[ProtocolFewShotExample]:
+        """Convert Example models to ProtocolFewShotExample schemas.
         
         Args:
-            example: The Example model to convert
+            examples: The Example models to convert
             
         Returns:
-            ProtocolFewShotExample schema object
+            List of ProtocolFewShotExample schema objects
         """
-        return ProtocolFewShotExample(
-            content=example.content,
-            label=example.label,  # type: ignore (already 'PASS' or 'FAIL')
-            description=example.description or "",
-        )
+        return _FEW_SHOT_EXAMPLES_ADAPTER.validate_python([
+            {
+                "content": example.content,
+                "label": example.label,  # already 'PASS' or 'FAIL'
+                "description": example.description or "",
+            }
+            for example in examples
+        ])
 
     def _build_routing_map(self, step: WorkflowStep) -> ProtocolRoutingMap:
         """Build routing map from step routing data.
@@ -40,6 +40,23 @@ STATUS_COLORS = {
     "delivered": "green",
 }
 
+# 前进 / 回退时的下一个状态
+NEXT_STATUS = {
+    "draft": "worker_done",
+    "worker_done": "expert_done",
+    "expert_done": "analyzed",
+    "analyzed": "confirmed",
+    "confirmed": "delivered",
+}
+
+PREV_STATUS = {
+    "worker_done": "draft",
+    "expert_done": "worker_done",
+    "analyzed": "expert_done",
+    "confirmed": "analyzed",
+    "delivered": "confirmed",
+}
+
 
 async def get_workflow_status(
     db: AsyncSession,
@@ -113,15 +130,7 @@ async def advance_workflow_status(
     
     # 获取下一个状态（只取前进方向的）
     current = workflow.status
-    next_status_map = {
-        "draft": "worker_done",
-        "worker_done": "expert_done",
-        "expert_done": "analyzed",
-        "analyzed": "confirmed",
-        "confirmed": "delivered",
-    }
-    
-    next_status = next_status_map.get(current)
+    next_status = NEXT_STATUS.get(current)
     if not next_status:
         return {
             "success": False,
@@ -158,15 +167,7 @@ async def rollback_workflow_status(
     
     # 获取上一个状态
     current = workflow.status
-    prev_status_map = {
-        "worker_done": "draft",
-        "expert_done": "worker_done",
-        "analyzed": "expert_done",
-        "confirmed": "analyzed",
-        "delivered": "confirmed",
-    }
-    
-    prev_status = prev_status_map.get(current)
+    prev_status = PREV_STATUS.get(current)
     if not prev_status:
         return {
             "success": False,
@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import RoutingBranch, WorkflowStep
 from app.repositories.step import StepRepository
@@ -46,25 +46,25 @@ class StepOrderConflictError(Exception):
 class StepService:
     """Service for workflow step business logic."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service with database session."""
         self.db = db
         self.repository = StepRepository(db)
         self.workflow_repository = WorkflowRepository(db)
 
 
-    def create_step(
+    async def create_step(
         self,
         workflow_id: UUID,
         data: WorkflowStepCreate,
     ) -> WorkflowStepResponse:
         """Create a new step in a workflow."""
         # Verify workflow exists
-        if not self.workflow_repository.exists(workflow_id):
+        if not await self.workflow_repository.exists(workflow_id):
             raise WorkflowNotFoundError(workflow_id)
 
         # Check if step_order already exists
-        if self.repository.check_order_exists(workflow_id, data.step_order):
+        if await self.repository.check_order_exists(workflow_id, data.step_order):
             raise StepOrderConflictError(workflow_id, data.step_order)
 
         step = WorkflowStep(
@@ -84,21 +84,21 @@ class StepService:
             logic_evaluation_prompt=data.logic_evaluation_prompt,
             routing_default_next=data.routing_default_next,
         )
-        created = self.repository.create(step)
-        return WorkflowStepResponse.model_validate(created)
+        created = await self.repository.create(step)
+        return WorkflowStepResponse.from_orm_fast(created)
 
-    def create_step_auto_order(
+    async def create_step_auto_order(
         self,
         workflow_id: UUID,
         data: WorkflowStepCreate,
     ) -> WorkflowStepResponse:
         """Create a new step with auto-assigned order (append to end)."""
         # Verify workflow exists
-        if not self.workflow_repository.exists(workflow_id):
+        if not await self.workflow_repository.exists(workflow_id):
             raise WorkflowNotFoundError(workflow_id)
 
         # Get next order
-        max_order = self.repository.get_max_order(workflow_id)
+        max_order = await self.repository.get_max_order(workflow_id)
         next_order = max_order + 1
 
         step = WorkflowStep(
@@ -118,25 +118,25 @@ class StepService:
             logic_evaluation_prompt=data.logic_evaluation_prompt,
             routing_default_next=data.routing_default_next,
         )
-        created = self.repository.create(step)
-        return WorkflowStepResponse.model_validate(created)
+        created = await self.repository.create(step)
+        return WorkflowStepResponse.from_orm_fast(created)
 
-    def get_step(self, step_id: UUID) -> WorkflowStepResponse:
+    async def get_step(self, step_id: UUID) -> WorkflowStepResponse:
         """Get a step by ID."""
-        step = self.repository.get_by_id(step_id)
+        step = await self.repository.get_by_id(step_id)
         if not step:
             raise StepNotFoundError(step_id)
-        return WorkflowStepResponse.model_validate(step)
+        return WorkflowStepResponse.from_orm_fast(step)
 
-    def get_step_or_none(self, step_id: UUID) -> Optional[WorkflowStepResponse]:
+    async def get_step_or_none(self, step_id: UUID) -> Optional[WorkflowStepResponse]:
         """Get a step by ID, return None if not found."""
-        step = self.repository.get_by_id(step_id)
+        step = await self.repository.get_by_id(step_id)
         if not step:
             return None
-        return WorkflowStepResponse.model_validate(step)
+        return WorkflowStepResponse.from_orm_fast(step)
 
 
-    def list_steps(
+    async def list_steps(
         self,
         workflow_id: UUID,
         page: int = 1,
@@ -144,30 +144,43 @@ class StepService:
     ) -> list[WorkflowStepResponse]:
         """List all steps for a workflow."""
         # Verify workflow exists
-        if not self.workflow_repository.exists(workflow_id):
+        if not await self.workflow_repository.exists(workflow_id):
             raise WorkflowNotFoundError(workflow_id)
 
         skip = (page - 1) * page_size
-        steps = self.repository.get_by_workflow_id(
+        steps = await self.repository.get_by_workflow_id(
             workflow_id, skip=skip, limit=page_size
         )
-        return [WorkflowStepResponse.model_validate(s) for s in steps]
+        return [WorkflowStepResponse.from_orm_fast(s) for s in steps]
 
-    def count_steps(self, workflow_id: UUID) -> int:
+    async def count_steps(self, workflow_id: UUID) -> int:
         """Count steps in a workflow."""
-        if not self.workflow_repository.exists(workflow_id):
+        if not await self.workflow_repository.exists(workflow_id):
             raise WorkflowNotFoundError(workflow_id)
-        return self.repository.count_by_workflow_id(workflow_id)
+        return await self.repository.count_by_workflow_id(workflow_id)
 
-    def update_step(
+    async def _get_step_in_workflow(
+        self,
+        step_id: UUID,
+        workflow_id: Optional[UUID] = None,
+    ) -> WorkflowStep:
+        """Load a step, optionally checking it belongs to workflow_id.
+
+        归属校验与加载合并为一次查询，调用方无需先单独 get_step。
+        """
+        step = await self.repository.get_by_id(step_id)
+        if not step or (workflow_id is not None and step.workflow_id != workflow_id):
+            raise StepNotFoundError(step_id)
+        return step
+
+    async def update_step(
         self,
         step_id: UUID,
         data: WorkflowStepUpdate,
+        workflow_id: Optional[UUID] = None,
     ) -> WorkflowStepResponse:
         """Update a step."""
-        step = self.repository.get_by_id(step_id)
-        if not step:
-            raise StepNotFoundError(step_id)
+        step = await self._get_step_in_workflow(step_id, workflow_id)
 
         update_data = data.model_dump(exclude_unset=True)
 
@@ -175,38 +188,38 @@ class StepService:
         if "step_order" in update_data:
             new_order = update_data["step_order"]
             if new_order != step.step_order:
-                if self.repository.check_order_exists(step.workflow_id, new_order):
+                if await self.repository.check_order_exists(step.workflow_id, new_order):
                     raise StepOrderConflictError(step.workflow_id, new_order)
 
-        updated = self.repository.update(step, update_data)
-        return WorkflowStepResponse.model_validate(updated)
+        updated = await self.repository.update(step, update_data)
+        return WorkflowStepResponse.from_orm_fast(updated)
 
-    def delete_step(self, step_id: UUID) -> None:
+    async def delete_step(
+        self,
+        step_id: UUID,
+        workflow_id: Optional[UUID] = None,
+    ) -> None:
         """Delete a step and reorder remaining steps."""
-        step = self.repository.get_by_id(step_id)
-        if not step:
+        deleted = await self.repository.delete_by_id(step_id, workflow_id)
+        if deleted is None:
             raise StepNotFoundError(step_id)
 
-        workflow_id = step.workflow_id
-        deleted_order = step.step_order
-
-        self.repository.delete(step)
+        workflow_id, deleted_order = deleted
         # Reorder remaining steps
-        self.repository.reorder_steps_after_delete(workflow_id, deleted_order)
+        await self.repository.reorder_steps_after_delete(workflow_id, deleted_order)
 
-    def step_exists(self, step_id: UUID) -> bool:
+    async def step_exists(self, step_id: UUID) -> bool:
         """Check if a step exists."""
-        return self.repository.exists(step_id)
+        return await self.repository.exists(step_id)
 
-    def add_routing_branch(
+    async def add_routing_branch(
         self,
         step_id: UUID,
         branch_data: RoutingBranchCreate,
+        workflow_id: Optional[UUID] = None,
     ) -> WorkflowStepResponse:
         """Add a routing branch to a step."""
-        step = self.repository.get_by_id(step_id)
-        if not step:
-            raise StepNotFoundError(step_id)
+        step = await self._get_step_in_workflow(step_id, workflow_id)
 
         branch = RoutingBranch(
             step_id=step_id,
@@ -215,19 +228,18 @@ class StepService:
             next_step_id=branch_data.next_step_id,
         )
         self.db.add(branch)
-        self.db.commit()
-        self.db.refresh(step)
-        return WorkflowStepResponse.model_validate(step)
+        await self.db.commit()
+        await self.db.refresh(step)
+        return WorkflowStepResponse.from_orm_fast(step)
 
-    def remove_routing_branch(
+    async def remove_routing_branch(
         self,
         step_id: UUID,
         branch_id: UUID,
+        workflow_id: Optional[UUID] = None,
     ) -> WorkflowStepResponse:
         """Remove a routing branch from a step."""
-        step = self.repository.get_by_id(step_id)
-        if not step:
-            raise StepNotFoundError(step_id)
+        step = await self._get_step_in_workflow(step_id, workflow_id)
 
         # Find and remove the branch
         branch_to_remove = None
@@ -237,8 +249,8 @@ class StepService:
                 break
 
         if branch_to_remove:
-            self.db.delete(branch_to_remove)
-            self.db.commit()
-            self.db.refresh(step)
+            await self.db.delete(branch_to_remove)
+            await self.db.commit()
+            await self.db.refresh(step)
 
-        return WorkflowStepResponse.model_validate(step)
+        return WorkflowStepResponse.from_orm_fast(step)
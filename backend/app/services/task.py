@@ -1,40 +1,135 @@
 """Task service for managing workflow tasks."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.database import get_request_cache
 from app.models import Task, WorkflowStep
 
 
+# 任务列表中步骤只展示这些列，跳过语音转写、提示词等大文本字段
+_STEP_LIST_COLUMNS = (
+    WorkflowStep.name,
+    WorkflowStep.step_order,
+    WorkflowStep.context_description,
+    WorkflowStep.expert_notes,
+    WorkflowStep.status,
+)
+
+
 async def get_tasks_by_workflow(
     db: AsyncSession,
     workflow_id: UUID,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    after_order: Optional[int] = None,
 ) -> List[Task]:
-    """Get all tasks for a workflow, ordered by task_order."""
-    result = await db.execute(
+    """Get tasks for a workflow, ordered by task_order.
+
+    limit 为 None 时返回全部任务；传入 after_order 时改用 task_order 作为
+    游标做 keyset 分页（task_order 在同一工作流内唯一），不再使用 skip。
+    各任务的步骤由一次 IN 查询预加载（只取列表展示用到的列，
+    不再级联加载步骤的样本、分支与备注）。
+    """
+    stmt = (
         select(Task)
         .where(Task.workflow_id == workflow_id)
-        .options(selectinload(Task.steps))
+        .options(
+            selectinload(Task.steps)
+            .load_only(*_STEP_LIST_COLUMNS, raiseload=True)
+            .raiseload("*"),
+            raiseload("*"),
+        )
         .order_by(Task.task_order)
+        .limit(limit)
     )
+    if after_order is not None:
+        stmt = stmt.where(Task.task_order > after_order)
+    elif skip:
+        stmt = stmt.offset(skip)
+    result = await db.execute(stmt)
     return list(result.scalars().all())
 
 
+async def get_tasks_version(
+    db: AsyncSession,
+    workflow_id: UUID,
+) -> tuple:
+    """Get a cheap version of a workflow's task list for ETag validation.
+
+    一条 SQL 取任务与步骤各自的行数和 max(updated_at)：增删改都会改变其中一项；
+    按 workflow_id 聚合，不加载任务与步骤本身。
+    """
+    tasks = (
+        select(func.count().label("rows"), func.max(Task.updated_at).label("updated_at"))
+        .where(Task.workflow_id == workflow_id)
+        .subquery()
+    )
+    steps = (
+        select(func.count().label("rows"), func.max(WorkflowStep.updated_at).label("updated_at"))
+        .where(WorkflowStep.workflow_id == workflow_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(tasks.c.rows, tasks.c.updated_at, steps.c.rows, steps.c.updated_at)
+    )
+    return tuple(result.one())
+
+
+async def get_tasks_with_steps_count(
+    db: AsyncSession,
+    workflow_id: UUID,
+) -> List[Tuple[Task, int]]:
+    """Get all tasks for a workflow with their step counts, ordered by task_order.
+
+    步骤数由 Task.steps_count 的关联子查询在同一条 SQL 中计算，不加载步骤。
+    """
+    result = await db.execute(
+        select(Task, Task.steps_count)
+        .where(Task.workflow_id == workflow_id)
+        .options(raiseload("*"))
+        .order_by(Task.task_order)
+    )
+    return list(result.tuples().all())
+
+
 async def get_task_by_id(
     db: AsyncSession,
     task_id: UUID,
 ) -> Optional[Task]:
-    """Get a single task by ID."""
+    """Get a single task by ID.
+
+    同一请求内重复查询同一任务时直接返回请求级缓存中的对象。
+    """
+    cache = get_request_cache(db)
+    key = (Task.__name__, task_id)
+    if key in cache:
+        return cache[key]
     result = await db.execute(
         select(Task)
         .where(Task.id == task_id)
         .options(selectinload(Task.steps))
     )
-    return result.scalar_one_or_none()
+    task = result.scalar_one_or_none()
+    if task is not None:
+        cache[key] = task
+    return task
+
+
+async def get_next_task_order(
+    db: AsyncSession,
+    workflow_id: UUID,
+) -> int:
+    """Get the task_order for a task appended to the end of a workflow."""
+    result = await db.execute(
+        select(func.coalesce(func.max(Task.task_order), 0) + 1)
+        .where(Task.workflow_id == workflow_id)
+    )
+    return result.scalar_one()
 
 
 async def create_task(
@@ -70,12 +165,19 @@ async def update_task(
     if not task:
         return None
     
-    if name is not None:
-        task.name = name
-    if description is not None:
-        task.description = description
-    if status is not None:
-        task.status = status
+    changes = {
+        key: value
+        for key, value in (
+            ("name", name), ("description", description), ("status", status)
+        )
+        if value is not None and getattr(task, key) != value
+    }
+    # 没有实际变更（如前端自动保存提交的空请求）时跳过 COMMIT 与 refresh
+    if not changes:
+        return task
+    
+    for key, value in changes.items():
+        setattr(task, key, value)
     
     await db.commit()
     await db.refresh(task)
@@ -100,7 +202,7 @@ async def reorder_tasks(
     db: AsyncSession,
     workflow_id: UUID,
     task_ids: List[UUID],
-) -> List[Task]:
+) -> List[Tuple[Task, int]]:
     """Reorder tasks by updating their task_order."""
     for i, task_id in enumerate(task_ids, start=1):
         result = await db.execute(
@@ -111,4 +213,4 @@ async def reorder_tasks(
             task.task_order = i
     
     await db.commit()
-    return await get_tasks_by_workflow(db, workflow_id)
+    return await get_tasks_with_steps_count(db, workflow_id)
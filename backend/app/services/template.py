@@ -3,7 +3,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -119,6 +119,29 @@ async def get_templates(db: AsyncSession) -> List[Workflow]:
     return list(result.scalars().all())
 
 
+async def get_templates_version(db: AsyncSession) -> tuple:
+    """Get a cheap version of the template list for ETag validation.
+
+    一条 SQL 取模板、模板任务与模板步骤各自的行数和 max(updated_at)，
+    不加载模板本身。
+    """
+    template_ids = select(Workflow.id).where(Workflow.is_template == True)
+    versions = [
+        select(func.count().label("rows"), func.max(model.updated_at).label("updated_at"))
+        .where(condition)
+        .subquery()
+        for model, condition in (
+            (Workflow, Workflow.is_template == True),
+            (Task, Task.workflow_id.in_(template_ids)),
+            (WorkflowStep, WorkflowStep.workflow_id.in_(template_ids)),
+        )
+    ]
+    result = await db.execute(
+        select(*(column for version in versions for column in version.c))
+    )
+    return tuple(result.one())
+
+
 async def get_template_by_id(db: AsyncSession, template_id: UUID) -> Optional[Workflow]:
     """Get a template by ID."""
     result = await db.execute(
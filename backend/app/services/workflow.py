@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.workflow import Workflow
 from app.repositories.workflow import WorkflowRepository
@@ -16,6 +16,10 @@ from app.schemas.workflow import (
 )
 
 
+# 估算行数低于该值时仍使用精确 COUNT：小表上精确计数很便宜，估算反而可能偏差明显
+EXACT_COUNT_THRESHOLD = 10_000
+
+
 class WorkflowNotFoundError(Exception):
     """Raised when a workflow is not found."""
 
@@ -27,11 +31,11 @@ class WorkflowNotFoundError(Exception):
 class WorkflowService:
     """Service for workflow business logic."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service with database session."""
         self.repository = WorkflowRepository(db)
 
-    def create_workflow(self, data: WorkflowCreate) -> WorkflowResponse:
+    async def create_workflow(self, data: WorkflowCreate) -> WorkflowResponse:
         """Create a new workflow."""
         workflow = Workflow(
             name=data.name,
@@ -39,62 +43,60 @@ class WorkflowService:
             cover_image_url=data.cover_image_url,
             status=data.status,
         )
-        created = self.repository.create(workflow)
-        return WorkflowResponse.model_validate(created)
+        created = await self.repository.create(workflow)
+        return WorkflowResponse.from_orm_fast(created)
 
-    def get_workflow(self, workflow_id: UUID) -> WorkflowResponse:
+    async def get_workflow(self, workflow_id: UUID) -> WorkflowResponse:
         """Get a workflow by ID."""
-        workflow = self.repository.get_by_id(workflow_id)
+        workflow = await self.repository.get_by_id(workflow_id)
         if not workflow:
             raise WorkflowNotFoundError(workflow_id)
-        return WorkflowResponse.model_validate(workflow)
+        return WorkflowResponse.from_orm_fast(workflow)
 
 
-    def get_workflow_or_none(self, workflow_id: UUID) -> Optional[WorkflowResponse]:
+    async def get_workflow_or_none(self, workflow_id: UUID) -> Optional[WorkflowResponse]:
         """Get a workflow by ID, return None if not found."""
-        workflow = self.repository.get_by_id(workflow_id)
+        workflow = await self.repository.get_by_id(workflow_id)
         if not workflow:
             return None
-        return WorkflowResponse.model_validate(workflow)
+        return WorkflowResponse.from_orm_fast(workflow)
 
-    def list_workflows(
+    async def list_workflows(
         self,
         page: int = 1,
         page_size: int = 20,
     ) -> WorkflowListResponse:
         """List all workflows with pagination."""
         skip = (page - 1) * page_size
-        workflows = self.repository.get_all(skip=skip, limit=page_size)
-        total = self.repository.count()
+        workflows = await self.repository.get_all_summary(skip=skip, limit=page_size)
+        total = await self.repository.count_for_listing(EXACT_COUNT_THRESHOLD)
 
         return WorkflowListResponse(
-            items=[WorkflowSummary.model_validate(w) for w in workflows],
+            items=[WorkflowSummary.from_orm_fast(w) for w in workflows],
             total=total,
             page=page,
             page_size=page_size,
         )
 
-    def update_workflow(
+    async def update_workflow(
         self,
         workflow_id: UUID,
         data: WorkflowUpdate,
     ) -> WorkflowResponse:
         """Update a workflow."""
-        workflow = self.repository.get_by_id(workflow_id)
+        workflow = await self.repository.get_by_id(workflow_id)
         if not workflow:
             raise WorkflowNotFoundError(workflow_id)
 
         update_data = data.model_dump(exclude_unset=True)
-        updated = self.repository.update(workflow, update_data)
-        return WorkflowResponse.model_validate(updated)
+        updated = await self.repository.update(workflow, update_data)
+        return WorkflowResponse.from_orm_fast(updated)
 
-    def delete_workflow(self, workflow_id: UUID) -> None:
+    async def delete_workflow(self, workflow_id: UUID) -> None:
         """Delete a workflow."""
-        workflow = self.repository.get_by_id(workflow_id)
-        if not workflow:
+        if not await self.repository.delete_by_id(workflow_id):
             raise WorkflowNotFoundError(workflow_id)
-        self.repository.delete(workflow)
 
-    def workflow_exists(self, workflow_id: UUID) -> bool:
+    async def workflow_exists(self, workflow_id: UUID) -> bool:
         """Check if a workflow exists."""
-        return self.repository.exists(workflow_id)
+        return await self.repository.exists(workflow_id)
@@ -10,8 +10,8 @@ in the branch no longer existing in the routing_map.branches array.
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -29,26 +29,28 @@ from hypothesis import strategies as st
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
     # Ensure tables exist
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
-def create_workflow_with_step(db, workflow_data: dict) -> tuple[Workflow, WorkflowStep]:
+async def create_workflow_with_step(db, workflow_data: dict) -> tuple[Workflow, WorkflowStep]:
     """Create a Workflow with at least one step from generated data."""
     workflow = Workflow(
         name=workflow_data["name"],
@@ -66,9 +68,9 @@ def create_workflow_with_step(db, workflow_data: dict) -> tuple[Workflow, Workfl
     workflow.steps.append(step)
     
     db.add(workflow)
-    db.commit()
-    db.refresh(workflow)
-    db.refresh(step)
+    await db.commit()
+    await db.refresh(workflow)
+    await db.refresh(step)
     
     return workflow, step
 
@@ -91,7 +93,7 @@ class TestBranchRemovalCompleteness:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_branch_removal_removes_branch_from_routing_map(
+    async def test_branch_removal_removes_branch_from_routing_map(
         self, test_db, workflow, branch
     ):
         """
@@ -102,7 +104,7 @@ class TestBranchRemovalCompleteness:
         no longer existing in the step's routing_branches.
         """
         # Create workflow with a step
-        workflow_model, step = create_workflow_with_step(test_db, workflow)
+        workflow_model, step = await create_workflow_with_step(test_db, workflow)
         step_id = step.id
         
         # Create step service
@@ -115,7 +117,7 @@ class TestBranchRemovalCompleteness:
             next_step_id=branch["next_step_id"],
         )
         
-        updated_step = step_service.add_routing_branch(step_id, branch_create)
+        updated_step = await step_service.add_routing_branch(step_id, branch_create)
         
         # Verify branch was added
         assert len(updated_step.routing_branches) >= 1, (
@@ -126,7 +128,7 @@ class TestBranchRemovalCompleteness:
         added_branch_id = updated_step.routing_branches[-1].id
         
         # Remove the branch
-        result_step = step_service.remove_routing_branch(step_id, added_branch_id)
+        result_step = await step_service.remove_routing_branch(step_id, added_branch_id)
         
         # Verify the branch no longer exists in routing_branches
         branch_ids = [b.id for b in result_step.routing_branches]
@@ -138,8 +140,8 @@ class TestBranchRemovalCompleteness:
         
         # Cleanup
         workflow_repo = WorkflowRepository(test_db)
-        workflow_repo.delete(workflow_model)
-        test_db.commit()
+        await workflow_repo.delete(workflow_model)
+        await test_db.commit()
 
     @given(
         workflow=workflow_data(min_steps=0, max_steps=2),
@@ -151,7 +153,7 @@ class TestBranchRemovalCompleteness:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_removing_one_branch_preserves_others(
+    async def test_removing_one_branch_preserves_others(
         self, test_db, workflow, branches, branch_index_to_remove
     ):
         """
@@ -165,7 +167,7 @@ class TestBranchRemovalCompleteness:
             branch_index_to_remove = len(branches) - 1
         
         # Create workflow with a step
-        workflow_model, step = create_workflow_with_step(test_db, workflow)
+        workflow_model, step = await create_workflow_with_step(test_db, workflow)
         step_id = step.id
         
         # Create step service
@@ -179,7 +181,7 @@ class TestBranchRemovalCompleteness:
                 action_type=branch["action_type"],
                 next_step_id=branch["next_step_id"],
             )
-            updated_step = step_service.add_routing_branch(step_id, branch_create)
+            updated_step = await step_service.add_routing_branch(step_id, branch_create)
             added_branch_ids.append(updated_step.routing_branches[-1].id)
         
         # Get the branch ID to remove
@@ -190,7 +192,7 @@ class TestBranchRemovalCompleteness:
         ]
         
         # Remove the selected branch
-        result_step = step_service.remove_routing_branch(step_id, branch_id_to_remove)
+        result_step = await step_service.remove_routing_branch(step_id, branch_id_to_remove)
         
         # Verify the removed branch is gone
         result_branch_ids = [b.id for b in result_step.routing_branches]
@@ -207,5 +209,5 @@ class TestBranchRemovalCompleteness:
         
         # Cleanup
         workflow_repo = WorkflowRepository(test_db)
-        workflow_repo.delete(workflow_model)
-        test_db.commit()
+        await workflow_repo.delete(workflow_model)
+        await test_db.commit()
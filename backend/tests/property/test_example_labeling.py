@@ -10,8 +10,8 @@ for any example uploaded to the failing zone, the stored example SHALL have labe
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -29,26 +29,28 @@ from hypothesis import strategies as st
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def test_step(test_db):
+async def test_step(test_db):
     """Create a test workflow and step for example testing."""
     # Create a workflow
     workflow = Workflow(
@@ -57,8 +59,8 @@ def test_step(test_db):
         status="draft",
     )
     test_db.add(workflow)
-    test_db.commit()
-    test_db.refresh(workflow)
+    await test_db.commit()
+    await test_db.refresh(workflow)
     
     # Create a step
     step = WorkflowStep(
@@ -69,14 +71,14 @@ def test_step(test_db):
         logic_strategy="few_shot",
     )
     test_db.add(step)
-    test_db.commit()
-    test_db.refresh(step)
+    await test_db.commit()
+    await test_db.refresh(step)
     
     yield step
     
     # Cleanup
-    test_db.delete(workflow)
-    test_db.commit()
+    await test_db.delete(workflow)
+    await test_db.commit()
 
 
 # Strategy for generating example content
@@ -103,7 +105,7 @@ class TestExampleLabelingConsistency:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_passing_zone_labels_as_pass(
+    async def test_passing_zone_labels_as_pass(
         self, test_db, test_step, content, content_type, description
     ):
         """
@@ -122,7 +124,7 @@ class TestExampleLabelingConsistency:
         )
         
         # Create the example
-        created_example = service.create_example(test_step.id, example_data)
+        created_example = await service.create_example(test_step.id, example_data)
         
         # Verify the label is PASS
         assert created_example.label == "PASS", (
@@ -131,14 +133,14 @@ class TestExampleLabelingConsistency:
         )
         
         # Verify by loading from database
-        loaded_example = service.get_example(created_example.id)
+        loaded_example = await service.get_example(created_example.id)
         assert loaded_example.label == "PASS", (
             f"Loaded example should have label 'PASS', "
             f"but got '{loaded_example.label}'"
         )
         
         # Cleanup
-        service.delete_example(created_example.id)
+        await service.delete_example(created_example.id)
 
     @given(
         content=example_content_strategy,
@@ -150,7 +152,7 @@ class TestExampleLabelingConsistency:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_failing_zone_labels_as_fail(
+    async def test_failing_zone_labels_as_fail(
         self, test_db, test_step, content, content_type, description
     ):
         """
@@ -169,7 +171,7 @@ class TestExampleLabelingConsistency:
         )
         
         # Create the example
-        created_example = service.create_example(test_step.id, example_data)
+        created_example = await service.create_example(test_step.id, example_data)
         
         # Verify the label is FAIL
         assert created_example.label == "FAIL", (
@@ -178,14 +180,14 @@ class TestExampleLabelingConsistency:
         )
         
         # Verify by loading from database
-        loaded_example = service.get_example(created_example.id)
+        loaded_example = await service.get_example(created_example.id)
         assert loaded_example.label == "FAIL", (
             f"Loaded example should have label 'FAIL', "
             f"but got '{loaded_example.label}'"
         )
         
         # Cleanup
-        service.delete_example(created_example.id)
+        await service.delete_example(created_example.id)
 
     @given(
         content=example_content_strategy,
@@ -198,7 +200,7 @@ class TestExampleLabelingConsistency:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_label_preserved_after_storage(
+    async def test_label_preserved_after_storage(
         self, test_db, test_step, content, content_type, description, label
     ):
         """
@@ -218,7 +220,7 @@ class TestExampleLabelingConsistency:
         )
         
         # Create the example
-        created_example = service.create_example(test_step.id, example_data)
+        created_example = await service.create_example(test_step.id, example_data)
         
         # Verify the label matches what was provided
         assert created_example.label == label, (
@@ -227,7 +229,7 @@ class TestExampleLabelingConsistency:
         )
         
         # Verify by loading from database
-        loaded_example = service.get_example(created_example.id)
+        loaded_example = await service.get_example(created_example.id)
         assert loaded_example.label == label, (
             f"Loaded example label should be '{label}', "
             f"but got '{loaded_example.label}'"
@@ -235,15 +237,15 @@ class TestExampleLabelingConsistency:
         
         # Verify using the filtered list methods
         if label == "PASS":
-            passing_examples = service.list_passing_examples(test_step.id)
+            passing_examples = await service.list_passing_examples(test_step.id)
             assert any(e.id == created_example.id for e in passing_examples), (
                 "Example with PASS label should appear in passing examples list"
             )
         else:
-            failing_examples = service.list_failing_examples(test_step.id)
+            failing_examples = await service.list_failing_examples(test_step.id)
             assert any(e.id == created_example.id for e in failing_examples), (
                 "Example with FAIL label should appear in failing examples list"
             )
         
         # Cleanup
-        service.delete_example(created_example.id)
+        await service.delete_example(created_example.id)
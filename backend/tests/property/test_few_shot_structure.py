@@ -10,8 +10,8 @@ include a few_shot_examples array where each example has content, label, and des
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -27,22 +27,24 @@ from tests.property.strategies import workflow_data
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 def create_workflow_from_data(data: dict) -> Workflow:
@@ -112,7 +114,7 @@ class TestFewShotExamplesStructure:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_few_shot_examples_structure(self, test_db, data):
+    async def test_few_shot_examples_structure(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 7: Few-Shot Examples Structure**
         **Validates: Requirements 7.2**
@@ -124,12 +126,12 @@ class TestFewShotExamplesStructure:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Generate protocol JSON
         protocol_service = ProtocolService(test_db)
-        protocol = protocol_service.generate_protocol(workflow_id)
+        protocol = await protocol_service.generate_protocol(workflow_id)
         
         # Verify protocol is a ProtocolWorkflow instance
         assert isinstance(protocol, ProtocolWorkflow), (
@@ -196,5 +198,5 @@ class TestFewShotExamplesStructure:
                     )
         
         # Cleanup
-        repo.delete(saved_workflow)
-        test_db.commit()
+        await repo.delete(saved_workflow)
+        await test_db.commit()
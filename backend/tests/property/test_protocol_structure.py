@@ -10,12 +10,13 @@ all required fields: input_spec, logic_config, routing_map, and output_schema.
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
-from app.models.workflow import Workflow, WorkflowStep, Example, RoutingBranch
+from app.models.workflow import Workflow, WorkflowStep, Example, RoutingBranch, StepNote
 from app.repositories.workflow import WorkflowRepository
 from app.services.protocol import ProtocolService
 from app.schemas.protocol import (
@@ -31,22 +32,24 @@ from tests.property.strategies import workflow_data
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 def create_workflow_from_data(data: dict) -> Workflow:
@@ -115,7 +118,7 @@ class TestProtocolJSONStructureCompleteness:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_protocol_json_structure_completeness(self, test_db, data):
+    async def test_protocol_json_structure_completeness(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 6: Protocol JSON Structure Completeness**
         **Validates: Requirements 7.1**
@@ -127,12 +130,12 @@ class TestProtocolJSONStructureCompleteness:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Generate protocol JSON
         protocol_service = ProtocolService(test_db)
-        protocol = protocol_service.generate_protocol(workflow_id)
+        protocol = await protocol_service.generate_protocol(workflow_id)
         
         # Verify protocol is a ProtocolWorkflow instance
         assert isinstance(protocol, ProtocolWorkflow), (
@@ -213,6 +216,48 @@ class TestProtocolJSONStructureCompleteness:
             )
         
         # Cleanup
-        repo.delete(saved_workflow)
-        test_db.commit()
+        await repo.delete(saved_workflow)
+        await test_db.commit()
+
+
+class TestProtocolQueryCount:
+    """Protocol generation loads a workflow in a bounded number of statements."""
+
+    async def test_protocol_statement_count_is_independent_of_step_count(self, test_db):
+        """Workflow, steps, examples and routing branches: 4 statements, notes not loaded."""
+        workflow = Workflow(name="protocol-query-count")
+        for i in range(5):
+            step = WorkflowStep(name=f"step {i}", step_order=i, logic_strategy="few_shot")
+            step.examples.append(Example(content="c", label="PASS"))
+            step.routing_branches.append(
+                RoutingBranch(condition_result="PASS", action_type="next", next_step_id="x")
+            )
+            step.notes.append(StepNote(content_type="text", content="note"))
+            workflow.steps.append(step)
+        await WorkflowRepository(test_db).create(workflow)
+        workflow_id = workflow.id
+        # 清空身份映射，确保关系都从数据库重新加载
+        test_db.expunge_all()
+
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = test_db.bind.sync_engine
+        event.listen(sync_engine, "after_cursor_execute", count_statement)
+        try:
+            service = ProtocolService(test_db)
+            workflow = await service.repository.get_for_protocol(workflow_id)
+            protocol = service._convert_workflow_to_protocol(workflow)
+        finally:
+            event.remove(sync_engine, "after_cursor_execute", count_statement)
+            await test_db.execute(delete(Workflow).where(Workflow.id == workflow_id))
+            await test_db.commit()
+
+        assert len(protocol.steps) == 5
+        assert all(step.logic_config.few_shot_examples for step in protocol.steps)
+        assert all(step.routing_map.branches for step in protocol.steps)
+        assert len(statements) == 4, statements
+        assert not any("step_notes" in statement for statement in statements)
 
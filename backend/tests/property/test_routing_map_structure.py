@@ -11,8 +11,8 @@ and next_step_id for each branch.
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -30,22 +30,24 @@ from hypothesis import strategies as st
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 def create_workflow_with_routing(data: dict) -> Workflow:
@@ -105,7 +107,7 @@ class TestRoutingMapStructure:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_routing_map_has_default_next_and_branches(self, test_db, data):
+    async def test_routing_map_has_default_next_and_branches(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 8: Routing Map Structure**
         **Validates: Requirements 7.3**
@@ -117,12 +119,12 @@ class TestRoutingMapStructure:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Generate protocol JSON
         protocol_service = ProtocolService(test_db)
-        protocol = protocol_service.generate_protocol(workflow_id)
+        protocol = await protocol_service.generate_protocol(workflow_id)
         
         # Verify each step's routing_map structure
         for i, step in enumerate(protocol.steps):
@@ -153,8 +155,8 @@ class TestRoutingMapStructure:
             )
         
         # Cleanup
-        repo.delete(saved_workflow)
-        test_db.commit()
+        await repo.delete(saved_workflow)
+        await test_db.commit()
 
     @given(data=workflow_data(min_steps=1, max_steps=3))
     @settings(
@@ -162,7 +164,7 @@ class TestRoutingMapStructure:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_routing_branches_have_required_fields(self, test_db, data):
+    async def test_routing_branches_have_required_fields(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 8: Routing Map Structure**
         **Validates: Requirements 7.3**
@@ -175,12 +177,12 @@ class TestRoutingMapStructure:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Generate protocol JSON
         protocol_service = ProtocolService(test_db)
-        protocol = protocol_service.generate_protocol(workflow_id)
+        protocol = await protocol_service.generate_protocol(workflow_id)
         
         # Verify each step's routing branches structure
         for step_idx, step in enumerate(protocol.steps):
@@ -233,8 +235,8 @@ class TestRoutingMapStructure:
                 )
         
         # Cleanup
-        repo.delete(saved_workflow)
-        test_db.commit()
+        await repo.delete(saved_workflow)
+        await test_db.commit()
 
     @given(data=workflow_data(min_steps=1, max_steps=3))
     @settings(
@@ -242,7 +244,7 @@ class TestRoutingMapStructure:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_routing_branches_count_matches_input(self, test_db, data):
+    async def test_routing_branches_count_matches_input(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 8: Routing Map Structure**
         **Validates: Requirements 7.3**
@@ -255,12 +257,12 @@ class TestRoutingMapStructure:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Generate protocol JSON
         protocol_service = ProtocolService(test_db)
-        protocol = protocol_service.generate_protocol(workflow_id)
+        protocol = await protocol_service.generate_protocol(workflow_id)
         
         # Verify branch count matches for each step
         for step_idx, (input_step_data, protocol_step) in enumerate(
@@ -275,5 +277,5 @@ class TestRoutingMapStructure:
             )
         
         # Cleanup
-        repo.delete(saved_workflow)
-        test_db.commit()
+        await repo.delete(saved_workflow)
+        await test_db.commit()
@@ -10,8 +10,8 @@ with exactly N+1 steps.
 
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -28,23 +28,25 @@ from tests.property.strategies import (
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
     # Ensure tables exist
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 def create_workflow_from_data(data: dict) -> Workflow:
@@ -96,7 +98,7 @@ class TestStepAdditionInvariant:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_step_addition_increases_count_by_one(
+    async def test_step_addition_increases_count_by_one(
         self, test_db, workflow, new_step_name
     ):
         """
@@ -108,7 +110,7 @@ class TestStepAdditionInvariant:
         # Create and save the workflow
         workflow_model = create_workflow_from_data(workflow)
         workflow_repo = WorkflowRepository(test_db)
-        saved_workflow = workflow_repo.create(workflow_model)
+        saved_workflow = await workflow_repo.create(workflow_model)
         workflow_id = saved_workflow.id
         
         # Get initial step count
@@ -125,11 +127,11 @@ class TestStepAdditionInvariant:
         )
         
         # Add the step using auto_order to avoid order conflicts
-        step_service.create_step_auto_order(workflow_id, new_step_data)
+        await step_service.create_step_auto_order(workflow_id, new_step_data)
         
         # Refresh the workflow to get updated steps
         test_db.expire_all()
-        updated_workflow = workflow_repo.get_by_id(workflow_id)
+        updated_workflow = await workflow_repo.get_by_id(workflow_id)
         
         # Verify the invariant: step count should be exactly N+1
         final_count = len(updated_workflow.steps)
@@ -141,7 +143,7 @@ class TestStepAdditionInvariant:
         )
         
         # Cleanup
-        workflow_repo.delete(updated_workflow)
-        test_db.commit()
+        await workflow_repo.delete(updated_workflow)
+        await test_db.commit()
 
 
@@ -11,8 +11,8 @@ micro-step data, and routing configurations exactly as they were saved.
 import os
 import pytest
 from hypothesis import given, settings, HealthCheck
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.database import Base
 from app.core.config import get_settings
@@ -23,23 +23,25 @@ from tests.property.strategies import workflow_data
 
 # Use PostgreSQL test database
 app_settings = get_settings()
-TEST_DATABASE_URL = app_settings.database_url_sync
+TEST_DATABASE_URL = app_settings.database_url
 
 
 @pytest.fixture(scope="function")
-def test_db():
+async def test_db():
     """Create a database session for testing."""
-    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
     # Ensure tables exist
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
     db = TestSessionLocal()
     try:
         yield db
     finally:
-        db.rollback()
-        db.close()
+        await db.rollback()
+        await db.close()
+        await engine.dispose()
 
 
 def create_workflow_from_data(data: dict) -> Workflow:
@@ -213,7 +215,7 @@ class TestWorkflowPersistenceRoundTrip:
         suppress_health_check=[HealthCheck.function_scoped_fixture],
         deadline=None,
     )
-    def test_workflow_persistence_round_trip(self, test_db, data):
+    async def test_workflow_persistence_round_trip(self, test_db, data):
         """
         **Feature: universal-sop-architect, Property 2: Workflow Persistence Round-Trip**
         **Validates: Requirements 10.1, 10.2, 10.3**
@@ -225,14 +227,14 @@ class TestWorkflowPersistenceRoundTrip:
         
         # Save to database
         repo = WorkflowRepository(test_db)
-        saved_workflow = repo.create(workflow)
+        saved_workflow = await repo.create(workflow)
         workflow_id = saved_workflow.id
         
         # Clear session to ensure fresh load
         test_db.expire_all()
         
         # Load from database
-        loaded_workflow = repo.get_by_id(workflow_id)
+        loaded_workflow = await repo.get_by_id(workflow_id)
         
         # Verify round-trip
         assert loaded_workflow is not None, "Workflow should be found after save"
@@ -243,5 +245,5 @@ class TestWorkflowPersistenceRoundTrip:
         )
         
         # Cleanup
-        repo.delete(loaded_workflow)
-        test_db.commit()
+        await repo.delete(loaded_workflow)
+        await test_db.commit()
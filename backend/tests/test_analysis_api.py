@@ -1,5 +1,6 @@
 """Tests for AI Analysis API."""
 
+import time
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -7,7 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.services.ai_analysis import AnalysisResult
 
 
@@ -146,3 +147,203 @@ class TestAIAnalysisService:
         # Should return fallback result
         assert result.confidence_score == 0.0
         assert "无法解析" in result.passing_features
+
+
+class TestAnalysisJobEndpoints:
+    """Tests for background analysis job endpoints."""
+
+    def test_submit_job_with_llm_disabled(self):
+        """Test that job submission fails when LLM is disabled."""
+        with patch("app.routers.analysis.get_llm_service") as mock_llm:
+            mock_llm.return_value.is_enabled.return_value = False
+
+            response = client.post(f"/api/analysis/steps/{uuid4()}/analyze/jobs")
+
+        assert response.status_code == 503
+
+    def test_get_unknown_job(self):
+        """Test polling an unknown job returns 404."""
+        response = client.get(f"/api/analysis/jobs/{uuid4()}")
+
+        assert response.status_code == 404
+
+    @staticmethod
+    def _submit_and_poll(analyze):
+        """Submit a job with AIAnalysisService.analyze_step_examples mocked, poll until finished."""
+        from unittest.mock import AsyncMock
+
+        mock_service = MagicMock()
+        mock_service.return_value.analyze_step_examples = AsyncMock(side_effect=analyze)
+        mock_session = MagicMock()
+        mock_session.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        app.dependency_overrides[get_async_db] = lambda: MagicMock()
+        try:
+            with patch("app.routers.analysis.get_llm_service") as mock_llm, \
+                    patch("app.routers.analysis.StepRepository") as mock_repo, \
+                    patch("app.services.analysis_job.get_llm_service"), \
+                    patch("app.services.analysis_job.AIAnalysisService", mock_service), \
+                    patch("app.services.analysis_job.AsyncSessionLocal", mock_session), \
+                    TestClient(app) as job_client:
+                mock_llm.return_value.is_enabled.return_value = True
+                mock_repo.return_value.exists = AsyncMock(return_value=True)
+
+                step_id = uuid4()
+                response = job_client.post(f"/api/analysis/steps/{step_id}/analyze/jobs")
+                assert response.status_code == 202
+                job_id = response.json()["job_id"]
+
+                for _ in range(50):
+                    data = job_client.get(f"/api/analysis/jobs/{job_id}").json()
+                    if data["state"] != "pending":
+                        break
+                    time.sleep(0.01)
+        finally:
+            app.dependency_overrides.pop(get_async_db, None)
+
+        mock_service.return_value.analyze_step_examples.assert_awaited_once()
+        return step_id, data
+
+    def test_submit_job_poll_done(self):
+        """Test that a submitted job finishes with the analysis result."""
+        from app.services.ai_analysis import AnalysisResponse, StepContract
+
+        async def analyze(step_id, previous_outputs):
+            return AnalysisResponse(
+                step_id=str(step_id),
+                step_name="读取电表",
+                result=AnalysisResult(
+                    contract=StepContract(
+                        step_id=1,
+                        step_name="读取电表",
+                        business_intent="识别读数",
+                        inputs=[],
+                        outputs=[],
+                    ),
+                    confidence_score=0.9,
+                ),
+                llm_model="test-model",
+                has_materials=True,
+            )
+
+        step_id, data = self._submit_and_poll(analyze)
+
+        assert data["state"] == "done"
+        assert data["step_id"] == str(step_id)
+        assert data["result"]["step_name"] == "读取电表"
+        assert data["error"] is None
+
+    def test_submit_job_poll_error(self):
+        """Test that an analysis failure is reported as an error state."""
+        from app.services.ai_analysis import AnalysisError
+
+        async def analyze(step_id, previous_outputs):
+            raise AnalysisError("AI analysis failed: boom")
+
+        _, data = self._submit_and_poll(analyze)
+
+        assert data["state"] == "error"
+        assert data["error"] == "AI analysis failed: boom"
+        assert data["result"] is None
+
+    def test_submit_job_when_registry_full(self):
+        """Test that submission is rejected while every retained job is pending."""
+        from unittest.mock import AsyncMock
+
+        from app.services import analysis_job
+        from app.services.analysis_job import AnalysisJobResponse
+
+        pending = AnalysisJobResponse(job_id=uuid4(), step_id=uuid4())
+        app.dependency_overrides[get_async_db] = lambda: MagicMock()
+        try:
+            with patch("app.routers.analysis.get_llm_service") as mock_llm, \
+                    patch("app.routers.analysis.StepRepository") as mock_repo, \
+                    patch.object(analysis_job, "MAX_ANALYSIS_JOBS", 1), \
+                    patch.dict(analysis_job._jobs, {pending.job_id: pending}, clear=True):
+                mock_llm.return_value.is_enabled.return_value = True
+                mock_repo.return_value.exists = AsyncMock(return_value=True)
+
+                response = client.post(f"/api/analysis/steps/{uuid4()}/analyze/jobs")
+        finally:
+            app.dependency_overrides.pop(get_async_db, None)
+
+        assert response.status_code == 429
+
+
+class TestParseAnalysisContract:
+    """Tests for contract parsing of LLM responses."""
+
+    def test_well_formed_fields_are_parsed(self):
+        """Test that well-formed input/output fields are kept as-is."""
+        from app.services.ai_analysis import AIAnalysisService
+
+        service = AIAnalysisService(MagicMock(), MagicMock())
+        raw_response = '''```json
+{
+    "contract": {
+        "step_id": 2,
+        "step_name": "读取电表",
+        "business_intent": "识别电表读数",
+        "inputs": [{"name": "meter_image", "type": "image", "description": "电表照片"}],
+        "outputs": [{"name": "reading", "type": "float", "description": "读数", "example": 12.5}]
+    },
+    "confidence_score": 0.9
+}
+```'''
+
+        result = service._parse_analysis_result(raw_response)
+
+        assert result.contract.inputs[0].name == "meter_image"
+        assert result.contract.inputs[0].required is True
+        assert result.contract.outputs[0].example == "12.5"
+        assert result.confidence_score == 0.9
+
+    def test_mistyped_fields_are_validated(self):
+        """Test that fields with non-native types still go through validation."""
+        from app.services.ai_analysis import AIAnalysisService
+
+        service = AIAnalysisService(MagicMock(), MagicMock())
+        raw_response = (
+            '{"contract": {"step_name": "a", "business_intent": "b", '
+            '"inputs": [{"name": "x", "description": "d", "required": "false"}], '
+            '"outputs": [{"name": "y", "description": null}]}}'
+        )
+
+        result = service._parse_analysis_result(raw_response)
+
+        # description 为 null 无法通过校验，返回解析错误的兜底结果
+        assert result.contract.step_name == "解析错误"
+        assert result.confidence_score == 0.0
+
+
+class TestAnalyzeEmptyStep:
+    """Tests for the empty-step short circuit."""
+
+    @pytest.mark.asyncio
+    async def test_empty_step_skips_prompt_assembly(self):
+        """Test that an empty step returns early without building the prompt."""
+        from unittest.mock import AsyncMock
+
+        from app.services.ai_analysis import AIAnalysisService
+
+        step = MagicMock(
+            context_image_url=None,
+            context_text_content=None,
+            context_voice_transcript=None,
+            context_description=None,
+            logic_evaluation_prompt=None,
+            expert_notes=None,
+            notes=[],
+        )
+        step.name = "空步骤"
+        service = AIAnalysisService(MagicMock(), MagicMock(model="test-model"))
+        service.step_repo = MagicMock(get_by_id=AsyncMock(return_value=step))
+
+        with patch.object(AIAnalysisService, "_build_step_input") as build_input:
+            result = await service.analyze_step_examples(uuid4())
+
+        build_input.assert_not_called()
+        service.llm.aanalyze_text.assert_not_called()
+        assert result.step_name == "空步骤"
+        assert result.has_materials is False
@@ -1,7 +1,7 @@
 """Example API endpoint tests."""
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -12,6 +12,7 @@ from app.routers.example import get_example_service
 from app.schemas.workflow import ExampleResponse
 from app.services.example import (
     ExampleNotFoundError,
+    ExampleService,
     StepNotFoundError,
 )
 
@@ -19,7 +20,7 @@ from app.services.example import (
 @pytest.fixture
 def mock_example_service():
     """Create a mock example service."""
-    return MagicMock()
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -179,6 +180,45 @@ class TestCreateExample:
         assert response.status_code == 404
 
 
+class TestCreateExamplesBatch:
+    """Tests for POST /api/steps/{step_id}/examples/batch endpoint."""
+
+    def test_create_examples_batch(self, client, mock_example_service):
+        """Test creating several examples in one request."""
+        step_id = uuid4()
+        mock_example_service.create_examples.return_value = [
+            make_example_response(step_id=step_id, content="p1", label="PASS"),
+            make_example_response(step_id=step_id, content="f1", label="FAIL"),
+        ]
+
+        response = client.post(
+            f"/api/steps/{step_id}/examples/batch",
+            json=[
+                {"content": "p1", "label": "PASS"},
+                {"content": "f1", "label": "FAIL"},
+            ],
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [e["label"] for e in data] == ["PASS", "FAIL"]
+        args = mock_example_service.create_examples.call_args.args
+        assert args[0] == step_id
+        assert len(args[1]) == 2
+
+    def test_create_examples_batch_step_not_found(self, client, mock_example_service):
+        """Test batch creation for non-existent step."""
+        step_id = uuid4()
+        mock_example_service.create_examples.side_effect = StepNotFoundError(step_id)
+
+        response = client.post(
+            f"/api/steps/{step_id}/examples/batch",
+            json=[{"content": "test", "label": "PASS"}],
+        )
+
+        assert response.status_code == 404
+
+
 
 class TestGetExample:
     """Tests for GET /api/examples/{example_id} endpoint."""
@@ -271,3 +311,31 @@ class TestDeleteExample:
         response = client.delete(f"/api/examples/{example_id}")
 
         assert response.status_code == 404
+
+
+class TestExampleServiceStepCheck:
+    """Tests for the step existence check in ExampleService reads."""
+
+    @pytest.fixture
+    def service(self):
+        service = ExampleService(MagicMock())
+        service.repository = AsyncMock()
+        service.step_repository = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_non_empty_count_skips_step_check(self, service):
+        """Test that a non-zero count does not query the step."""
+        service.repository.count_by_step_id.return_value = 3
+
+        assert await service.count_examples(uuid4()) == 3
+        service.step_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_list_of_missing_step_raises(self, service):
+        """Test that an empty result still reports a missing step."""
+        service.repository.get_by_step_id.return_value = []
+        service.step_repository.exists.return_value = False
+
+        with pytest.raises(StepNotFoundError):
+            await service.list_examples_by_step(uuid4())
@@ -0,0 +1,111 @@
+"""StepNote API endpoint tests."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_async_db
+from app.main import app
+from app.routers.note import MAX_STEP_IDS_PER_REQUEST
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock async session whose SELECT returns no notes."""
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=make_result([]))
+    return db
+
+
+@pytest.fixture
+def client(mock_db):
+    """Create a test client with the database session mocked."""
+    app.dependency_overrides[get_async_db] = lambda: mock_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def make_result(notes):
+    """Helper to build a mock execute() result yielding the given notes."""
+    result = MagicMock()
+    result.scalars.return_value = notes
+    return result
+
+
+def make_note(step_id, content="note", content_type="text"):
+    """Helper to create a StepNote-like object."""
+    return SimpleNamespace(
+        id=uuid4(),
+        step_id=step_id,
+        content_type=content_type,
+        content=content,
+        voice_transcript=None,
+        created_by="worker",
+    )
+
+
+class TestGetNotesForSteps:
+    """Tests for GET /api/notes/steps endpoint."""
+
+    def test_notes_grouped_by_step(self, client, mock_db):
+        """Test notes for several steps are grouped under their step_id."""
+        step_a, step_b = uuid4(), uuid4()
+        mock_db.execute.return_value = make_result([
+            make_note(step_a, "a1"),
+            make_note(step_b, "b1"),
+            make_note(step_a, "a2"),
+        ])
+
+        response = client.get(
+            "/api/notes/steps",
+            params={"step_ids": [str(step_a), str(step_b)]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {str(step_a), str(step_b)}
+        assert [n["content"] for n in data[str(step_a)]["items"]] == ["a1", "a2"]
+        assert [n["content"] for n in data[str(step_b)]["items"]] == ["b1"]
+        # 所有步骤的笔记由一条 SELECT 取回
+        assert mock_db.execute.await_count == 1
+
+    def test_step_without_notes_maps_to_empty_list(self, client, mock_db):
+        """Test a requested step with no notes is present with no items."""
+        step_a, step_empty = uuid4(), uuid4()
+        mock_db.execute.return_value = make_result([make_note(step_a)])
+
+        response = client.get(
+            "/api/notes/steps",
+            params={"step_ids": [str(step_a), str(step_empty)]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data[str(step_a)]["items"]) == 1
+        assert data[str(step_empty)] == {"items": []}
+
+    def test_missing_step_ids(self, client, mock_db):
+        """Test omitting step_ids returns 422."""
+        response = client.get("/api/notes/steps")
+
+        assert response.status_code == 422
+        mock_db.execute.assert_not_called()
+
+    def test_empty_step_ids(self, client, mock_db):
+        """Test an empty step_ids value returns 422."""
+        response = client.get("/api/notes/steps?step_ids=")
+
+        assert response.status_code == 422
+        mock_db.execute.assert_not_called()
+
+    def test_too_many_step_ids(self, client, mock_db):
+        """Test more than the allowed number of step_ids returns 422."""
+        step_ids = [str(uuid4()) for _ in range(MAX_STEP_IDS_PER_REQUEST + 1)]
+
+        response = client.get("/api/notes/steps", params={"step_ids": step_ids})
+
+        assert response.status_code == 422
+        mock_db.execute.assert_not_called()
@@ -6,7 +6,7 @@ from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.main import app
 from app.schemas.protocol import (
     ProtocolFewShotExample,
@@ -38,7 +38,7 @@ def mock_protocol_service():
 def client(mock_db, mock_protocol_service):
     """Create a test client with mocked dependencies."""
     # Override the database dependency
-    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_async_db] = lambda: mock_db
     
     # We need to patch the ProtocolService instantiation
     original_init = ProtocolService.__init__
@@ -1,6 +1,7 @@
 """Tests for Pydantic schemas."""
 
 import pytest
+from types import SimpleNamespace
 from uuid import uuid4
 from datetime import datetime
 
@@ -10,6 +11,7 @@ from app.schemas import (
     WorkflowUpdate,
     WorkflowStepCreate,
     WorkflowStepResponse,
+    WorkflowSummary,
     ExampleCreate,
     ExampleResponse,
     RoutingBranchCreate,
@@ -123,6 +125,58 @@ class TestRoutingBranchSchemas:
         assert branch.action_type == "REJECT"
 
 
+class TestFromOrmFast:
+    """from_orm_fast must produce the same output as model_validate."""
+
+    @staticmethod
+    def _workflow_obj():
+        now = datetime.now()
+        workflow_id = uuid4()
+        step_id = uuid4()
+        example = SimpleNamespace(
+            id=uuid4(), step_id=step_id, created_at=now,
+            content="/uploads/a.jpg", content_type="image",
+            label="PASS", description=None,
+        )
+        branch = SimpleNamespace(
+            id=uuid4(), step_id=step_id, created_at=now,
+            condition_result="FAIL", action_type="REJECT", next_step_id="end",
+        )
+        step = SimpleNamespace(
+            id=step_id, workflow_id=workflow_id, created_at=now, updated_at=now,
+            name="Step 1", step_order=0, status="pending",
+            context_type="text", context_image_url=None,
+            context_text_content="text", context_voice_transcript=None,
+            context_description="desc", extraction_keywords=["a", "b"],
+            extraction_voice_transcript=None, logic_strategy="few_shot",
+            logic_rule_expression=None, logic_evaluation_prompt="prompt",
+            routing_default_next=None,
+            examples=[example], routing_branches=[branch],
+        )
+        return SimpleNamespace(
+            id=workflow_id, created_at=now, updated_at=now,
+            name="Workflow", description=None, cover_image_url=None,
+            status="draft", steps=[step],
+        )
+
+    def test_workflow_response_matches_model_validate(self):
+        """Nested steps, examples and branches are built identically."""
+        obj = self._workflow_obj()
+        fast = WorkflowResponse.from_orm_fast(obj)
+        assert fast.model_dump() == WorkflowResponse.model_validate(obj).model_dump()
+        assert isinstance(fast.steps[0], WorkflowStepResponse)
+        assert isinstance(fast.steps[0].examples[0], ExampleResponse)
+        assert isinstance(fast.steps[0].routing_branches[0], RoutingBranchResponse)
+
+    def test_workflow_summary_matches_model_validate(self):
+        """Summary ignores nested relations entirely."""
+        obj = self._workflow_obj()
+        assert (
+            WorkflowSummary.from_orm_fast(obj).model_dump()
+            == WorkflowSummary.model_validate(obj).model_dump()
+        )
+
+
 class TestProtocolSchemas:
     """Tests for Protocol schemas."""
 
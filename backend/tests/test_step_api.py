@@ -1,7 +1,7 @@
 """Step API endpoint tests."""
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
@@ -20,7 +20,7 @@ from app.services.step import (
 @pytest.fixture
 def mock_step_service():
     """Create a mock step service."""
-    return MagicMock()
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -218,11 +218,6 @@ class TestUpdateStep:
         """Test updating a step."""
         workflow_id = uuid4()
         step_id = uuid4()
-        mock_step_service.get_step.return_value = make_step_response(
-            step_id=step_id,
-            workflow_id=workflow_id,
-            name="Old Name",
-        )
         mock_step_service.update_step.return_value = make_step_response(
             step_id=step_id,
             workflow_id=workflow_id,
@@ -242,7 +237,7 @@ class TestUpdateStep:
         """Test updating a non-existent step."""
         workflow_id = uuid4()
         step_id = uuid4()
-        mock_step_service.get_step.side_effect = StepNotFoundError(step_id)
+        mock_step_service.update_step.side_effect = StepNotFoundError(step_id)
 
         response = client.put(
             f"/api/workflows/{workflow_id}/steps/{step_id}",
@@ -259,10 +254,6 @@ class TestDeleteStep:
         """Test deleting a step."""
         workflow_id = uuid4()
         step_id = uuid4()
-        mock_step_service.get_step.return_value = make_step_response(
-            step_id=step_id,
-            workflow_id=workflow_id,
-        )
         mock_step_service.delete_step.return_value = None
 
         response = client.delete(f"/api/workflows/{workflow_id}/steps/{step_id}")
@@ -273,7 +264,7 @@ class TestDeleteStep:
         """Test deleting a non-existent step."""
         workflow_id = uuid4()
         step_id = uuid4()
-        mock_step_service.get_step.side_effect = StepNotFoundError(step_id)
+        mock_step_service.delete_step.side_effect = StepNotFoundError(step_id)
 
         response = client.delete(f"/api/workflows/{workflow_id}/steps/{step_id}")
 
@@ -287,10 +278,6 @@ class TestRoutingBranches:
         """Test adding a routing branch."""
         workflow_id = uuid4()
         step_id = uuid4()
-        mock_step_service.get_step.return_value = make_step_response(
-            step_id=step_id,
-            workflow_id=workflow_id,
-        )
         mock_step_service.add_routing_branch.return_value = make_step_response(
             step_id=step_id,
             workflow_id=workflow_id,
@@ -312,10 +299,6 @@ class TestRoutingBranches:
         workflow_id = uuid4()
         step_id = uuid4()
         branch_id = uuid4()
-        mock_step_service.get_step.return_value = make_step_response(
-            step_id=step_id,
-            workflow_id=workflow_id,
-        )
         mock_step_service.remove_routing_branch.return_value = make_step_response(
             step_id=step_id,
             workflow_id=workflow_id,
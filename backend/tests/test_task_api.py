@@ -0,0 +1,75 @@
+"""Task API endpoint tests."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_async_db
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with the database session mocked."""
+    app.dependency_overrides[get_async_db] = lambda: MagicMock()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def mock_task_service():
+    """Patch the task service functions used by the task list endpoint."""
+    with patch("app.routers.task.task_service") as service:
+        service.get_tasks_version = AsyncMock(
+            return_value=(1, datetime(2025, 1, 1, tzinfo=timezone.utc), 0, None)
+        )
+        service.get_tasks_by_workflow = AsyncMock(return_value=[])
+        yield service
+
+
+class TestGetWorkflowTasksETag:
+    """Tests for ETag handling on GET /api/tasks/workflow/{workflow_id}."""
+
+    def test_not_modified_skips_list_query(self, client, mock_task_service):
+        """Test a matching If-None-Match returns 304 without loading tasks."""
+        path = f"/api/tasks/workflow/{uuid4()}"
+
+        first = client.get(path)
+        etag = first.headers["etag"]
+        mock_task_service.get_tasks_by_workflow.reset_mock()
+        second = client.get(path, headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.json() == {"items": []}
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+        mock_task_service.get_tasks_by_workflow.assert_not_called()
+
+    def test_changed_version_returns_body(self, client, mock_task_service):
+        """Test a new version yields a new ETag and a full response."""
+        path = f"/api/tasks/workflow/{uuid4()}"
+
+        etag = client.get(path).headers["etag"]
+        mock_task_service.get_tasks_version.return_value = (
+            2, datetime(2025, 1, 2, tzinfo=timezone.utc), 0, None
+        )
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_etag_depends_on_pagination(self, client, mock_task_service):
+        """Test the same data under different page params gets a different ETag."""
+        path = f"/api/tasks/workflow/{uuid4()}"
+
+        etag = client.get(path).headers["etag"]
+        response = client.get(
+            path, params={"page_size": 1}, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
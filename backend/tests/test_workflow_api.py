@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
@@ -16,7 +16,7 @@ from app.services.workflow import WorkflowNotFoundError
 @pytest.fixture
 def mock_workflow_service():
     """Create a mock workflow service."""
-    return MagicMock()
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -75,6 +75,24 @@ class TestListWorkflows:
         assert response.status_code == 200
         mock_workflow_service.list_workflows.assert_called_once_with(page=2, page_size=10)
 
+    def test_list_workflows_not_modified(self, client, mock_workflow_service):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        mock_workflow_service.list_workflows.return_value = WorkflowListResponse(
+            items=[],
+            total=0,
+            page=1,
+            page_size=20,
+        )
+
+        first = client.get("/api/workflows")
+        etag = first.headers["etag"]
+        second = client.get("/api/workflows", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
 
 class TestCreateWorkflow:
     """Tests for POST /api/workflows endpoint."""
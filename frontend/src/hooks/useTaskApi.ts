@@ -183,6 +183,25 @@ export function useNotes(stepId: string | undefined) {
     return { notes, loading, error, refetch: fetchNotes, createNote, deleteNote };
 }
 
+// 一次请求批量获取多个步骤的 notes，返回 stepId -> notes
+export async function fetchNotesByStepIds<T = NoteData>(stepIds: string[]): Promise<Record<string, T[]>> {
+    const result: Record<string, T[]> = {};
+    if (stepIds.length === 0) return result;
+    try {
+        const params = new URLSearchParams();
+        stepIds.forEach(id => params.append('step_ids', id));
+        const res = await fetch(`${API_BASE}/api/notes/steps?${params.toString()}`);
+        if (!res.ok) throw new Error('Failed to fetch notes');
+        const data: Record<string, { items: T[] }> = await res.json();
+        for (const [stepId, list] of Object.entries(data)) {
+            result[stepId] = list.items || [];
+        }
+    } catch (err) {
+        console.error('Failed to fetch notes:', err);
+    }
+    return result;
+}
+
 // 更新步骤（包括描述和专家备注）
 export async function updateStep(stepId: string, data: { context_description?: string; expert_notes?: string }) {
     try {
@@ -22,6 +22,7 @@ import {
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 import { useAnalyzeAllSteps } from '@/hooks/useAnalysis';
+import { fetchNotesByStepIds } from '@/hooks/useTaskApi';
 
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -96,24 +97,17 @@ export default function ExpertOrganize() {
             if (!tasksRes.ok) throw new Error('Failed to fetch tasks');
             const tasksData = await tasksRes.json();
 
-            // 获取每个步骤的 notes
-            const tasksWithNotes = await Promise.all(
-                (tasksData.items || []).map(async (task: TaskData) => {
-                    const stepsWithNotes = await Promise.all(
-                        (task.steps || []).map(async (step: StepData) => {
-                            try {
-                                const notesRes = await fetch(`${API_BASE}/api/notes/step/${step.id}`);
-                                if (notesRes.ok) {
-                                    const notesData = await notesRes.json();
-                                    return { ...step, notes: notesData.items || [] };
-                                }
-                            } catch { }
-                            return { ...step, notes: [] };
-                        })
-                    );
-                    return { ...task, steps: stepsWithNotes };
-                })
+            // 一次请求获取所有步骤的 notes
+            const notesByStep = await fetchNotesByStepIds<NoteData>(
+                (tasksData.items || []).flatMap((task: TaskData) => (task.steps || []).map((step: StepData) => step.id))
             );
+            const tasksWithNotes = (tasksData.items || []).map((task: TaskData) => ({
+                ...task,
+                steps: (task.steps || []).map((step: StepData) => ({
+                    ...step,
+                    notes: notesByStep[step.id] || [],
+                })),
+            }));
 
             setTasks(tasksWithNotes);
         } catch (e) {
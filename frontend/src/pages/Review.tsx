@@ -22,6 +22,7 @@ import {
   AlertCircle
 } from 'lucide-react';
 import type { StepContract, DataField, AnalysisResponse } from '@/hooks/useAnalysis';
+import { fetchNotesByStepIds } from '@/hooks/useTaskApi';
 
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -111,6 +112,11 @@ export default function Review() {
         const tasksData = await tasksRes.json();
         const loadedTasks: TaskData[] = [];
 
+        // 一次请求加载所有步骤的 notes
+        const notesByStep = await fetchNotesByStepIds(
+          (tasksData.items || []).flatMap((task: TaskData) => (task.steps || []).map((step: StepData) => step.id))
+        );
+
         for (const task of (tasksData.items || [])) {
           const taskWithNotes: TaskData = {
             id: task.id,
@@ -119,15 +125,8 @@ export default function Review() {
             steps: [],
           };
 
-          // 加载每个步骤的 notes
           for (const step of (task.steps || [])) {
-            try {
-              const notesRes = await fetch(`${API_BASE}/api/notes/step/${step.id}`);
-              if (notesRes.ok) {
-                const notesData = await notesRes.json();
-                step.notes = notesData.items || [];
-              }
-            } catch { }
+            step.notes = notesByStep[step.id] || [];
             taskWithNotes.steps.push(step);
           }
 
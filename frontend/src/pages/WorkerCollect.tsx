@@ -17,6 +17,7 @@ import {
     CheckCircle2
 } from 'lucide-react';
 import { Button } from '@/components/ui/button';
+import { fetchNotesByStepIds } from '@/hooks/useTaskApi';
 
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -91,29 +92,19 @@ export default function WorkerCollect() {
             if (!tasksRes.ok) throw new Error('Failed to fetch tasks');
             const tasksData = await tasksRes.json();
 
-            // 为每个任务获取步骤和 notes
-            const tasksWithSteps = await Promise.all(
-                (tasksData.items || []).map(async (task: any) => {
-                    // 获取每个 step 的 notes
-                    const stepsWithNotes = await Promise.all(
-                        (task.steps || []).map(async (step: any) => {
-                            try {
-                                const notesRes = await fetch(`${API_BASE}/api/notes/step/${step.id}`);
-                                if (notesRes.ok) {
-                                    const notesData = await notesRes.json();
-                                    return { ...step, notes: notesData.items || [], expanded: false };
-                                }
-                            } catch { /* ignore */ }
-                            return { ...step, notes: [], expanded: false };
-                        })
-                    );
-                    return {
-                        ...task,
-                        steps: stepsWithNotes,
-                        expanded: true,
-                    };
-                })
+            // 一次请求获取所有步骤的 notes
+            const notesByStep = await fetchNotesByStepIds(
+                (tasksData.items || []).flatMap((task: any) => (task.steps || []).map((step: any) => step.id))
             );
+            const tasksWithSteps = (tasksData.items || []).map((task: any) => ({
+                ...task,
+                steps: (task.steps || []).map((step: any) => ({
+                    ...step,
+                    notes: notesByStep[step.id] || [],
+                    expanded: false,
+                })),
+                expanded: true,
+            }));
 
             setTasks(tasksWithSteps);
         } catch (e) {